@@ -0,0 +1,94 @@
+# Copyright 2020-2022 Foreseeti AB <https://foreseeti.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """A cache where entries expire ``ttl`` seconds after they were stored.
+
+    A ``ttl`` of zero or less disables the cache, nothing is stored and every
+    lookup is a miss. Expired entries are kept for another ``stale`` seconds,
+    during which :meth:`get_stale` still returns them.
+    """
+
+    def __init__(self, ttl: float, stale: float = 0) -> None:
+        self.ttl = ttl
+        self.stale = stale
+        self._entries: dict[K, tuple[float, V]] = {}
+        # Keys that are being refreshed, with the token of the refresh
+        self._refreshing: dict[K, object] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self.get_stale(key)
+        if entry is None:
+            return None
+        value, expired = entry
+        return None if expired else value
+
+    def get_stale(self, key: K) -> Optional[tuple[V, bool]]:
+        """Returns the value stored for ``key`` and whether it has expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        timestamp, value = entry
+        age = time.monotonic() - timestamp
+        if age >= self.ttl + self.stale:
+            self._entries.pop(key, None)
+            return None
+        return value, age >= self.ttl
+
+    def set(self, key: K, value: V) -> None:
+        if self.ttl > 0:
+            self._entries[key] = (time.monotonic(), value)
+
+    def begin_refresh(self, key: K) -> Optional[object]:
+        """Marks ``key`` as being refreshed and returns a token for
+        :meth:`end_refresh`, or ``None`` if ``key`` is already being refreshed.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return None
+            token = object()
+            self._refreshing[key] = token
+            return token
+
+    def end_refresh(self, key: K, token: object, value: Optional[V] = None) -> None:
+        """Stores ``value`` for ``key`` unless ``key`` was invalidated after the
+        refresh began. Without a ``value`` the refresh is only ended.
+        """
+        with self._lock:
+            if self._refreshing.get(key) is not token:
+                return
+            del self._refreshing[key]
+            if value is not None:
+                self.set(key, value)
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._refreshing.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._refreshing.clear()
@@ -14,11 +14,19 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import asyncio
+import functools
+import importlib
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional, TypeVar
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.util.retry import Retry
 
+from securicad.enterprise import codec
 from securicad.enterprise.exceptions import StatusCodeException
 from securicad.enterprise.metadata import Metadata
 from securicad.enterprise.models import Models
@@ -31,6 +39,16 @@ from securicad.enterprise.tunings import Tunings
 from securicad.enterprise.users import Users
 from securicad.enterprise.util import Util
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+# The same endpoints are joined with the backend URL over and over. The cache is
+# bounded, as endpoints with a pid or tag in them take any number of values.
+@functools.lru_cache(maxsize=256)
+def _join_url(backend_url: str, endpoint: str) -> str:
+    return urljoin(backend_url, endpoint)
+
 
 class Client:
     def __init__(
@@ -43,9 +61,29 @@ class Client:
         backend_url: Optional[str] = None,
         cacert: Optional[bool | str] = None,
         client_cert: Optional[str | tuple[str, str]] = None,
+        msgpack: bool = False,
+        cache_ttl: float = 0,
+        cache_stale: float = 0,
+        parallelism: int = 8,
+        prefetch: bool = False,
     ) -> None:
+        self._cache_ttl = cache_ttl
+        self._cache_stale = cache_stale
+        self._parallelism = parallelism
+        # Background fetches share one executor, it only exists when enabled
+        self._prefetch = prefetch
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_finalizer: Optional[weakref.finalize] = None
+        if prefetch or cache_stale > 0:
+            self._executor = ThreadPoolExecutor(max_workers=max(parallelism, 1))
+            # The worker threads are also stopped if the client is garbage
+            # collected without being closed
+            self._executor_finalizer = weakref.finalize(
+                self, self._executor.shutdown, wait=False
+            )
         self.__init_urls(base_url, backend_url)
         self.__init_session(cacert, client_cert)
+        self.__init_msgpack(msgpack)
 
         self.organizations: Organizations = Organizations(client=self)
         self.users: Users = Users(client=self)
@@ -73,6 +111,9 @@ class Client:
             backend_url = base_url
         self._backend_url = urljoin(backend_url, "/api/v1/")
 
+    def __get_url(self, endpoint: str) -> str:
+        return _join_url(self._backend_url, endpoint)
+
     def __init_session(
         self, cacert: Optional[bool | str], client_cert: Optional[str | tuple[str, str]]
     ) -> None:
@@ -85,6 +126,32 @@ class Client:
         self._session = requests.Session()
         self._session.headers["User-Agent"] = get_user_agent()
 
+        # Keep enough idle connections around for concurrent requests made by
+        # _map(), the default pool only keeps 10 connections per host
+        pool_size = max(self._parallelism, DEFAULT_POOLSIZE)
+        # Requests that failed to connect were never sent and are always
+        # retried. Other failures and unavailable gateways are only retried for
+        # GET requests, several PUT and DELETE endpoints are not idempotent.
+        # The last response is still checked by __request().
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=("GET", "HEAD", "OPTIONS"),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Responses to GET requests that carried an ETag, keyed by URL
+        self._etag_cache: dict[str, requests.Response] = {}
+
+        # The logged in user as returned by whoami, it depends on the token
+        self._whoami: Optional[dict[str, Any]] = None
+
         # Server certificate verification
         if cacert is not None:
             if cacert is False:
@@ -98,12 +165,23 @@ class Client:
         if client_cert is not None:
             self._session.cert = client_cert
 
+    def __init_msgpack(self, msgpack: bool) -> None:
+        # The msgpack package is optional, only import it if it is requested
+        self._msgpack: Any = None
+        if msgpack:
+            self._msgpack = importlib.import_module("msgpack")
+            self._session.headers["Accept"] = (
+                "application/x-msgpack, application/json;q=0.9"
+            )
+
     def _get_access_token(self) -> Optional[str]:
         if "Authorization" not in self._session.headers:
             return None
         return self._session.headers["Authorization"][len("JWT ") :]
 
     def _set_access_token(self, access_token: Optional[str]) -> None:
+        # Cached data may not be visible to the new user
+        self.cache_clear()
         if access_token is None:
             if "Authorization" in self._session.headers:
                 del self._session.headers["Authorization"]
@@ -111,11 +189,63 @@ class Client:
             self._session.headers["Authorization"] = f"JWT {access_token}"
 
     def __request(self, method: str, endpoint: str, data: Any, status_code: int) -> Any:
-        url = urljoin(self._backend_url, endpoint)
-        response = self._session.request(method, url, json=data)
-        if response.status_code != status_code:
+        url = self.__get_url(endpoint)
+        headers: dict[str, str] = {}
+        cached_response = self._etag_cache.get(url) if method == "GET" else None
+        if cached_response is not None:
+            headers["If-None-Match"] = cached_response.headers["ETag"]
+        body: Optional[bytes] = None
+        if data is not None:
+            body = codec.dumps(data)
+            headers["Content-Type"] = "application/json"
+        response = self._session.request(method, url, data=body, headers=headers)
+        if response.status_code == 304 and cached_response is not None:
+            response = cached_response
+        elif response.status_code != status_code:
             raise StatusCodeException(status_code, method, url, response)
-        return response.json()["response"]
+        elif method == "GET":
+            if "ETag" in response.headers:
+                self._etag_cache[url] = response
+            else:
+                self._etag_cache.pop(url, None)
+        return self.__decode(response)["response"]
+
+    def __decode(self, response: requests.Response) -> Any:
+        content_type = response.headers.get("Content-Type", "")
+        if self._msgpack is not None and content_type.startswith(
+            "application/x-msgpack"
+        ):
+            return self._msgpack.unpackb(response.content, raw=False)
+        # Decoding the bytes directly skips the charset detection that
+        # response.json() may run on the body first
+        return codec.loads(response.content)
+
+    def _map(self, func: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Calls ``func`` for each item, running up to ``parallelism`` calls at once.
+
+        The results are returned in the same order as ``items``.
+        """
+        items = list(items)
+        if self._parallelism <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        max_workers = min(self._parallelism, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, items))
+
+    async def _run_async(self, func: Callable[..., R], *args: Any) -> R:
+        """Awaits ``func(*args)`` running in the event loop's default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    def _submit(self, func: Callable[..., R], *args: Any) -> Future[R]:
+        """Calls ``func(*args)`` in the background, requires ``prefetch`` or
+        ``cache_stale``.
+        """
+        if self._executor is None:
+            raise RuntimeError(
+                "Background fetches are disabled or the client is closed"
+            )
+        return self._executor.submit(func, *args)
 
     def _get(self, endpoint: str, data: Any = None, status_code: int = 200) -> Any:
         return self.__request("GET", endpoint, data, status_code)
@@ -129,6 +259,34 @@ class Client:
     def _delete(self, endpoint: str, data: Any = None, status_code: int = 200) -> Any:
         return self.__request("DELETE", endpoint, data, status_code)
 
+    def cache_clear(self) -> None:
+        """Drops all cached data, so that it is fetched again when it is needed."""
+        self._etag_cache.clear()
+        self._whoami = None
+        self.organizations._invalidate()
+        self.users._invalidate()
+        self.projects._invalidate()
+        self.models._invalidate()
+        self.scenarios._invalidate()
+
+    def close(self) -> None:
+        """Closes the pooled connections and stops prefetching.
+
+        Later requests open new connections as needed.
+        """
+        self._session.close()
+        if self._executor_finalizer is not None:
+            self._executor_finalizer()
+            self._executor_finalizer = None
+            self._executor = None
+            self._prefetch = False
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     def login(
         self, username: str, password: str, organization: Optional[str] = None
     ) -> None:
@@ -0,0 +1,55 @@
+# Copyright 2020-2022 Foreseeti AB <https://foreseeti.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import io
+import json
+from typing import Any
+
+# orjson is an optional dependency used to decode responses, the standard
+# library is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def dumps(obj: Any) -> bytes:
+    """Encodes ``obj`` as compact UTF-8 encoded JSON.
+
+    The standard library is used even if orjson is installed, so that request
+    bodies are the same on every install. orjson would send NaN and infinity
+    as null instead of raising :class:`ValueError`.
+    """
+    return json.dumps(obj, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_io(obj: Any) -> io.BytesIO:
+    """Encodes ``obj`` like :func:`dumps` into a buffer positioned at the start."""
+    # The encoder's chunks are written to the buffer as they are produced, so
+    # the whole document never exists as a str
+    buffer = io.BytesIO()
+    text_io = io.TextIOWrapper(buffer, encoding="utf-8", newline="", write_through=True)
+    json.dump(obj, text_io, allow_nan=False, separators=(",", ":"))
+    text_io.detach()
+    buffer.seek(0)
+    return buffer
+
+
+def loads(data: bytes | str) -> Any:
+    """Decodes JSON from ``data``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -23,13 +23,19 @@ def deprecated(
     message: str,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        warned = False
+
+        # functools.wraps also exposes the undecorated function as __wrapped__
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            warn(
-                f"DEPRECATED {func.__name__}: {message}",
-                DeprecationWarning,
-                stacklevel=2,
-            )
+            nonlocal warned
+            if not warned:
+                warned = True
+                warn(
+                    f"DEPRECATED {func.__name__}: {message}",
+                    DeprecationWarning,
+                    stacklevel=2,
+                )
             return func(*args, **kwargs)
 
         return wrapper
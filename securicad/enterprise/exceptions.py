@@ -40,3 +40,10 @@ class StatusCodeException(Exception):
             ]
         )
         super().__init__(message)
+
+
+class SimulationFailedException(Exception):
+    def __init__(self, simid: str, name: str) -> None:
+        self.simid = simid
+        self.name = name
+        super().__init__(f"Simulation {self.name} ({self.simid}) failed")
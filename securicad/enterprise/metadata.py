@@ -16,7 +16,8 @@ from __future__ import annotations
 
 import json
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any, cast
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from securicad.enterprise.client import Client
@@ -41,36 +42,34 @@ class Metadata:
 
     def get_metadata(self) -> list[dict[str, Any]]:
         def parse_risktype(attackstep: dict[str, Any]) -> list[RiskType]:
-            if "riskType" not in attackstep:
-                return []
+            risk_type = attackstep.get("riskType", "")
             retr: list[RiskType] = []
-            if "Availability" in attackstep["riskType"]:
+            if "Availability" in risk_type:
                 retr.append(RiskType.AVAILABILITY)
-            if "Confidentiality" in attackstep["riskType"]:
+            if "Confidentiality" in risk_type:
                 retr.append(RiskType.CONFIDENTIALITY)
-            if "Integrity" in attackstep["riskType"]:
+            if "Integrity" in risk_type:
                 retr.append(RiskType.INTEGRITY)
             return retr
 
+        def parse_attackstep(attackstep: dict[str, Any]) -> dict[str, Any]:
+            return {
+                "name": attackstep["name"],
+                "description": attackstep["description"],
+                "risktype": parse_risktype(attackstep),
+                "metaInfo": attackstep.get("metaInfo", {}),
+            }
+
         metadata = self.client._get("metadata")
-        metalist: list[dict[str, Any]] = []
-        for asset, data in metadata["assets"].items():
-            attacksteps: list[dict[str, Any]] = []
-            for attackstep in data["attacksteps"]:
-                attacksteps.append(
-                    {
-                        "name": attackstep["name"],
-                        "description": attackstep["description"],
-                        "risktype": parse_risktype(attackstep),
-                        "metaInfo": attackstep.get("metaInfo", {}),
-                    }
-                )
-            metalist.append(
-                {
-                    "name": asset,
-                    "description": data["description"],
-                    "attacksteps": attacksteps,
-                    "metaInfo": data.get("metaInfo", {}),
-                }
-            )
-        return sorted(metalist, key=lambda asset: cast(str, asset["name"]))
+        metalist: list[dict[str, Any]] = [
+            {
+                "name": asset,
+                "description": data["description"],
+                "attacksteps": [
+                    parse_attackstep(attackstep) for attackstep in data["attacksteps"]
+                ],
+                "metaInfo": data.get("metaInfo", {}),
+            }
+            for asset, data in metadata["assets"].items()
+        ]
+        return sorted(metalist, key=itemgetter("name"))
@@ -16,13 +16,14 @@ from __future__ import annotations
 
 import base64
 import time
-from typing import TYPE_CHECKING, Any, BinaryIO, Optional
-
-from securicad.model import Model, es_serializer
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Optional
 
+from securicad.enterprise.cache import TTLCache
 from securicad.enterprise.deprecation import deprecated
 
 if TYPE_CHECKING:
+    from securicad.model import Model
+
     from securicad.enterprise.client import Client
     from securicad.enterprise.projects import Project
 
@@ -99,6 +100,7 @@ class ModelInfo:
         if samples is not None:
             data["samples"] = samples
         dict_model = self.client._post("model", data)
+        self.client.models._invalidate(self.pid)
         threshold, samples, _ = self.client.models._get_model_data(self.pid, self.mid)
         self.name = dict_model["name"]
         self.description = dict_model["description"]
@@ -107,12 +109,15 @@ class ModelInfo:
 
     def delete(self) -> None:
         self.client._delete("models", {"pid": self.pid, "mids": [self.mid]})
+        self.client.models._invalidate(self.pid)
 
     def lock(self) -> None:
         self.client._post("model/lock", {"mid": self.mid})
+        self.client.models._invalidate(self.pid)
 
     def release(self) -> None:
         self.client._post("model/release", {"mid": self.mid})
+        self.client.models._invalidate(self.pid)
 
     def get_scad(self) -> bytes:
         data: dict[str, Any] = {"pid": self.pid, "mids": [self.mid]}
@@ -127,9 +132,16 @@ class ModelInfo:
         return dict_model
 
     def get_model(self) -> Model:
+        # securicad.model is only imported once it's needed
+        # pylint: disable=import-outside-toplevel
+        from securicad.model import es_serializer
+
         return es_serializer.deserialize_model(self.get_dict())
 
     def save(self, model: Model) -> ModelInfo:
+        # pylint: disable=import-outside-toplevel
+        from securicad.model import es_serializer
+
         dict_model = es_serializer.serialize_model(model)
         dict_model["mid"] = self.mid
         dict_model["name"] = self.name
@@ -143,10 +155,22 @@ class ModelInfo:
 class Models:
     def __init__(self, client: Client) -> None:
         self.client = client
+        self._dict_models_cache: TTLCache[str, list[dict[str, Any]]] = TTLCache(
+            client._cache_ttl
+        )
+
+    def _invalidate(self, pid: Optional[str] = None) -> None:
+        """Drops the cached models of project ``pid``, or of all projects if
+        ``pid`` is ``None``.
+        """
+        if pid is None:
+            self._dict_models_cache.clear()
+        else:
+            self._dict_models_cache.invalidate(pid)
 
     def _wait_for_model_validation(self, pid: str, mid: str) -> ModelInfo:
         while True:
-            for dict_model in self._list_dict_models(pid):
+            for dict_model in self._list_dict_models(pid, use_cache=False):
                 if dict_model["mid"] != mid:
                     continue
                 if _get_is_valid(dict_model["valid"]) is not None:
@@ -156,8 +180,15 @@ class Models:
                 break
             time.sleep(1)
 
-    def _list_dict_models(self, pid: str) -> list[dict[str, Any]]:
+    def _list_dict_models(
+        self, pid: str, use_cache: bool = True
+    ) -> list[dict[str, Any]]:
+        if use_cache:
+            cached_models = self._dict_models_cache.get(pid)
+            if cached_models is not None:
+                return cached_models
         dict_models: list[dict[str, Any]] = self.client._post("models", {"pid": pid})
+        self._dict_models_cache.set(pid, dict_models)
         return dict_models
 
     def _get_model_data(self, pid: str, mid: str) -> tuple[int, int, dict[str, Any]]:
@@ -165,17 +196,17 @@ class Models:
         return model_data["threshold"], model_data["samples"], model_data["metadata"]
 
     def _list_models(self, project: Project) -> list[ModelInfo]:
+        def get_model_info(dict_model: dict[str, Any]) -> ModelInfo:
+            return ModelInfo.from_dict(client=self.client, dict_model=dict_model)
+
+        # ModelInfo.from_dict fetches "modeldata" for each model, so fetch them
+        # concurrently
         dict_models = self._list_dict_models(project.pid)
-        models: list[ModelInfo] = []
-        for dict_model in dict_models:
-            models.append(
-                ModelInfo.from_dict(client=self.client, dict_model=dict_model)
-            )
-        return models
+        return self.client._map(get_model_info, dict_models)
 
     @deprecated("Use Project.list_models()")
     def list_models(self, project: Project) -> list[ModelInfo]:
-        return project.list_models()
+        return self._list_models(project=project)
 
     def _get_model_by_mid(self, project: Project, mid: str) -> ModelInfo:
         dict_models = self._list_dict_models(project.pid)
@@ -186,23 +217,29 @@ class Models:
 
     @deprecated("Use Project.get_model_by_mid()")
     def get_model_by_mid(self, project: Project, mid: str) -> ModelInfo:
-        return project.get_model_by_mid(mid=mid)
+        return self._get_model_by_mid(project=project, mid=mid)
 
     def _get_model_by_name(self, project: Project, name: str) -> ModelInfo:
-        dict_models = self._list_dict_models(project.pid)
-        for dict_model in dict_models:
+        # Exact matches take precedence over case-insensitive matches
+        lower_name = name.lower()
+        fallback: Optional[dict[str, Any]] = None
+        for dict_model in self._list_dict_models(project.pid):
             if dict_model["name"] == name:
                 return ModelInfo.from_dict(client=self.client, dict_model=dict_model)
-        for dict_model in dict_models:
-            if dict_model["name"].lower() == name.lower():
-                return ModelInfo.from_dict(client=self.client, dict_model=dict_model)
+            if fallback is None and dict_model["name"].lower() == lower_name:
+                fallback = dict_model
+        if fallback is not None:
+            return ModelInfo.from_dict(client=self.client, dict_model=fallback)
         raise ValueError(f"Invalid model {name}")
 
     @deprecated("Use Project.get_model_by_name()")
     def get_model_by_name(self, project: Project, name: str) -> ModelInfo:
-        return project.get_model_by_name(name=name)
+        return self._get_model_by_name(project=project, name=name)
 
     def _save_as(self, project: Project, model: Model, name: str) -> ModelInfo:
+        # pylint: disable=import-outside-toplevel
+        from securicad.model import es_serializer
+
         dict_model = es_serializer.serialize_model(model)
         dict_model["name"] = f"{name}.sCAD"
         data: dict[str, Any] = {"pid": project.pid, "model": dict_model}
@@ -211,7 +248,7 @@ class Models:
 
     @deprecated("Use Project.save_as()")
     def save_as(self, project: Project, model: Model, name: str) -> ModelInfo:
-        return project.save_as(model=model, name=name)
+        return self._save_as(project=project, model=model, name=name)
 
     def _upload_scad_model(
         self,
@@ -256,19 +293,23 @@ class Models:
         file_io: BinaryIO,
         description: Optional[str] = None,
     ) -> ModelInfo:
-        return project.upload_scad_model(
-            filename=filename, file_io=file_io, description=description
+        return self._upload_scad_model(
+            project=project, filename=filename, file_io=file_io, description=description
         )
 
     def _generate_model(
-        self, project: Project, parser: str, name: str, files: list[dict[str, Any]]
+        self,
+        project: Project,
+        parser: str,
+        name: str,
+        files: Iterable[dict[str, Any]],
     ) -> ModelInfo:
         """Generates a model with a parser.
 
         :param project: The :class:`Project` to add the generated model to.
         :param parser: The name of the parser to use.
         :param name: The name of the generated model.
-        :param files: A list of dictionaries on the format
+        :param files: A list, or any other iterable, of dictionaries on the format
 
             .. code-block::
 
@@ -283,6 +324,9 @@ class Models:
             - ``<sub-parser-name>`` is the name of the sub-parser to use for the file
             - ``<file-name>`` is the name of the file
             - ``<binary-io>`` is either a file opened in binary mode, or a :class:`io.BytesIO` object.
+
+            Each file is read and encoded as it is consumed, so a generator
+            keeps only one raw file in memory at a time.
         :return: A :class:`ModelInfo` object representing the generated model.
         """
 
@@ -292,16 +336,14 @@ class Models:
             return file_base64
 
         def get_files() -> list[dict[str, Any]]:
-            _files: list[dict[str, Any]] = []
-            for file_dict in files:
-                _files.append(
-                    {
-                        "sub_parser": file_dict["sub_parser"],
-                        "name": file_dict["name"],
-                        "content": get_file_content(file_dict["file"]),
-                    }
-                )
-            return _files
+            return [
+                {
+                    "sub_parser": file_dict["sub_parser"],
+                    "name": file_dict["name"],
+                    "content": get_file_content(file_dict["file"]),
+                }
+                for file_dict in files
+            ]
 
         data: dict[str, Any] = {"parser": parser, "name": name, "files": get_files()}
         dict_model = self.client._post(f"projects/{project.pid}/multiparser", data)
@@ -311,4 +353,6 @@ class Models:
     def generate_model(
         self, project: Project, parser: str, name: str, files: list[dict[str, Any]]
     ) -> ModelInfo:
-        return project.generate_model(parser=parser, name=name, files=files)
+        return self._generate_model(
+            project=project, parser=parser, name=name, files=files
+        )
@@ -16,6 +16,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional
 
+from securicad.enterprise.cache import TTLCache
+
 if TYPE_CHECKING:
     from securicad.enterprise.client import Client
     from securicad.enterprise.projects import Project
@@ -23,6 +25,8 @@ if TYPE_CHECKING:
 
 
 class Organization:
+    __slots__ = ("client", "tag", "name")
+
     def __init__(self, client: Client, tag: str, name: str) -> None:
         self.client = client
         self.tag = tag
@@ -35,61 +39,102 @@ class Organization:
     def update(self, *, name: str) -> None:
         data: dict[str, Any] = {"tag": self.tag, "name": name}
         dict_org = self.client._post("organization", data)
+        self.client.organizations._invalidate(self.tag)
         self.name = dict_org["name"]
 
     def delete(self) -> None:
         self.client._delete("organization", {"tag": self.tag})
+        self.client.organizations._invalidate(self.tag)
+        self.client.projects._invalidate()
 
     def list_users(self) -> list[User]:
         dict_org = self.client.organizations._get_dict_organization_by_tag(self.tag)
-        users: list[User] = []
-        for dict_user in dict_org["users"]:
-            users.append(self.client.users.get_user_by_uid(dict_user["id"]))
-        return users
+        uids = [dict_user["id"] for dict_user in dict_org["users"]]
+        return self.client.users._get_users_by_uids(uids)
 
     def list_projects(self) -> list[Project]:
         dict_org = self.client.organizations._get_dict_organization_by_tag(self.tag)
-        projects: list[Project] = []
-        for dict_project in dict_org["projects"]:
-            projects.append(
-                self.client.projects.get_project_by_pid(dict_project["pid"])
-            )
-        return projects
+        pids = [dict_project["pid"] for dict_project in dict_org["projects"]]
+        return self.client.projects._get_projects_by_pids(pids)
 
 
 class Organizations:
     def __init__(self, client: Client) -> None:
         self.client = client
+        self._dict_orgs_cache: TTLCache[None, list[dict[str, Any]]] = TTLCache(
+            client._cache_ttl
+        )
+        self._dict_org_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+            client._cache_ttl
+        )
+
+    def _invalidate(self, tag: Optional[str] = None) -> None:
+        """Drops the cached organization listing and the cached data of
+        organization ``tag``, or of all organizations if ``tag`` is ``None``.
+        """
+        self._dict_orgs_cache.clear()
+        if tag is None:
+            self._dict_org_cache.clear()
+        else:
+            self._dict_org_cache.invalidate(tag)
 
     def _list_dict_organizations(self) -> list[dict[str, Any]]:
+        cached_organizations = self._dict_orgs_cache.get(None)
+        if cached_organizations is not None:
+            return cached_organizations
         dict_organizations: list[dict[str, Any]] = self.client._get("organization/all")
+        self._dict_orgs_cache.set(None, dict_organizations)
         return dict_organizations
 
     def _get_dict_organization_by_tag(self, tag: str) -> dict[str, Any]:
+        cached_organization = self._dict_org_cache.get(tag)
+        if cached_organization is not None:
+            return cached_organization
         dict_organization: dict[str, Any] = self.client._get(f"organization/{tag}")
+        self._dict_org_cache.set(tag, dict_organization)
         return dict_organization
 
     def list_organizations(self) -> list[Organization]:
-        dict_orgs = self._list_dict_organizations()
-        organizations: list[Organization] = []
-        for dict_org in dict_orgs:
-            organizations.append(
-                Organization.from_dict(client=self.client, dict_org=dict_org)
-            )
-        return organizations
+        return [
+            Organization.from_dict(client=self.client, dict_org=dict_org)
+            for dict_org in self._list_dict_organizations()
+        ]
 
     def get_organization_by_tag(self, tag: str) -> Organization:
         dict_org = self._get_dict_organization_by_tag(tag)
         return Organization.from_dict(client=self.client, dict_org=dict_org)
 
+    def get_organizations_by_tags(self, tags: list[str]) -> list[Organization]:
+        """Returns the organizations with the given tags, in the same order.
+
+        Organizations in the listing of all organizations are taken from one
+        request. Only unlisted tags are fetched separately, which fails for
+        tags that don't exist.
+        """
+        dict_orgs = {
+            dict_org["tag"]: dict_org for dict_org in self._list_dict_organizations()
+        }
+        missing_tags = [tag for tag in tags if tag not in dict_orgs]
+        for dict_org in self.client._map(
+            self._get_dict_organization_by_tag, missing_tags
+        ):
+            dict_orgs[dict_org["tag"]] = dict_org
+        return [
+            Organization.from_dict(client=self.client, dict_org=dict_orgs[tag])
+            for tag in tags
+        ]
+
     def get_organization_by_name(self, name: str) -> Organization:
-        organizations = self.list_organizations()
-        for organization in organizations:
+        # Exact matches take precedence over case-insensitive matches
+        lower_name = name.lower()
+        fallback: Optional[Organization] = None
+        for organization in self.list_organizations():
             if organization.name == name:
                 return organization
-        for organization in organizations:
-            if organization.name.lower() == name.lower():
-                return organization
+            if fallback is None and organization.name.lower() == lower_name:
+                fallback = organization
+        if fallback is not None:
+            return fallback
         raise ValueError(f"Invalid organization {name}")
 
     def create_organization(
@@ -99,4 +144,5 @@ class Organizations:
         if license is not None:
             data["license"] = license
         dict_org = self.client._put("organization", data)
+        self._invalidate(dict_org["tag"])
         return Organization.from_dict(client=self.client, dict_org=dict_org)
@@ -15,7 +15,9 @@
 from __future__ import annotations
 
 from enum import IntEnum, unique
-from typing import TYPE_CHECKING, Any, BinaryIO, Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Iterator, Optional
+
+from securicad.enterprise.cache import TTLCache
 
 if TYPE_CHECKING:
     from securicad.model import Model
@@ -37,13 +39,15 @@ class AccessLevel(IntEnum):
 
     @staticmethod
     def from_int(level: int) -> AccessLevel:
-        for access_level in AccessLevel:
-            if level == access_level:
-                return access_level
-        raise ValueError(f"Invalid access level {level}")
+        try:
+            return AccessLevel(level)
+        except ValueError:
+            raise ValueError(f"Invalid access level {level}") from None
 
 
 class Project:
+    __slots__ = ("client", "pid", "name", "description", "access_level")
+
     def __init__(
         self,
         client: Client,
@@ -77,28 +81,49 @@ class Project:
             "description": self.description if description is None else description,
         }
         dict_project = self.client._post("project", data)
+        self.client.projects._invalidate(self.pid)
         self.name = dict_project["name"]
         self.description = dict_project["description"]
 
     def delete(self) -> None:
         self.client._delete("project", {"pid": self.pid})
+        self.client.projects._invalidate(self.pid)
+        self.client.organizations._invalidate()
+        self.client.models._invalidate(self.pid)
+        self.client.scenarios._invalidate(self.pid)
 
     def list_users(self) -> list[User]:
         dict_project = self.client.projects._get_dict_project_by_pid(self.pid)
-        users: list[User] = []
-        for dict_user in dict_project["users"]:
-            users.append(self.client.users.get_user_by_uid(dict_user["uid"]))
-        return users
+        uids = [dict_user["uid"] for dict_user in dict_project["users"]]
+        return self.client.users._get_users_by_uids(uids)
 
     def add_user(self, user: User, access_level: Optional[AccessLevel] = None) -> None:
         data: dict[str, Any] = {"pid": self.pid, "uid": user.uid}
         if access_level is not None:
             data["accesslevel"] = int(access_level)
         self.client._put("project/user", data)
+        self.client.projects._invalidate(self.pid)
 
     def remove_user(self, user: User) -> None:
         data: dict[str, Any] = {"pid": self.pid, "uid": user.uid}
         self.client._delete("project/user", data)
+        self.client.projects._invalidate(self.pid)
+
+    def add_users(
+        self, users: list[User], access_level: Optional[AccessLevel] = None
+    ) -> None:
+        """Adds the users one at a time, in order.
+
+        The requests are not idempotent, so they are not sent concurrently. If
+        a request fails, the users before it in ``users`` have been added.
+        """
+        for user in users:
+            self.add_user(user, access_level)
+
+    def remove_users(self, users: list[User]) -> None:
+        """Removes the users one at a time, in order, like :meth:`add_users`."""
+        for user in users:
+            self.remove_user(user)
 
     def get_access_level(self, user: User) -> Optional[AccessLevel]:
         dict_project = self.client.projects._get_dict_project_by_pid(self.pid)
@@ -107,6 +132,20 @@ class Project:
                 return AccessLevel.from_int(dict_user["accesslevel"])
         return None
 
+    def list_access_levels(self) -> list[tuple[User, AccessLevel]]:
+        """Returns all users of the project together with their access levels.
+
+        Prefer this over calling :meth:`get_access_level` for each user in
+        :meth:`list_users`, which fetches the project once per user.
+        """
+        dict_project = self.client.projects._get_dict_project_by_pid(self.pid)
+        uids = [dict_user["uid"] for dict_user in dict_project["users"]]
+        users = self.client.users._get_users_by_uids(uids)
+        return [
+            (user, AccessLevel.from_int(dict_user["accesslevel"]))
+            for user, dict_user in zip(users, dict_project["users"])
+        ]
+
     def set_access_level(self, user: User, access_level: AccessLevel) -> None:
         data: dict[str, Any] = {
             "pid": self.pid,
@@ -114,6 +153,7 @@ class Project:
             "accesslevel": int(access_level),
         }
         self.client._post("project/user", data)
+        self.client.projects._invalidate(self.pid)
 
     ##
     # Models
@@ -131,6 +171,7 @@ class Project:
         mids = [model_info.mid for model_info in model_infos]
         data: dict[str, Any] = {"pid": self.pid, "mids": mids}
         self.client._post("models/import", data)
+        self.client.models._invalidate(self.pid)
 
     def save_as(self, model: Model, name: str) -> ModelInfo:
         return self.client.models._save_as(project=self, model=model, name=name)
@@ -143,7 +184,7 @@ class Project:
         )
 
     def generate_model(
-        self, parser: str, name: str, files: list[dict[str, Any]]
+        self, parser: str, name: str, files: Iterable[dict[str, Any]]
     ) -> ModelInfo:
         return self.client.models._generate_model(
             project=self, parser=parser, name=name, files=files
@@ -207,40 +248,91 @@ class Project:
             consequence=consequence,
         )
 
+    def create_tunings(self, tunings: list[dict[str, Any]]) -> list[Tuning]:
+        """Creates several tunings with one request.
+
+        :param tunings: A list of dictionaries with the keyword arguments of
+            :meth:`create_tuning`, e.g.
+            ``{"tuning_type": "ttc", "filterdict": {...}, "ttc": "Exponential,3"}``.
+        :return: A list of :class:`Tuning` objects in the same order as ``tunings``.
+        """
+        return self.client.tunings._create_tunings(project=self, tunings=tunings)
+
 
 class Projects:
     def __init__(self, client: Client) -> None:
         self.client = client
+        self._dict_projects_cache: TTLCache[None, list[dict[str, Any]]] = TTLCache(
+            client._cache_ttl
+        )
+        self._dict_project_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+            client._cache_ttl
+        )
+
+    def _invalidate(self, pid: Optional[str] = None) -> None:
+        """Drops the cached project listing and the cached data of project ``pid``,
+        or of all projects if ``pid`` is ``None``.
+        """
+        self._dict_projects_cache.clear()
+        if pid is None:
+            self._dict_project_cache.clear()
+        else:
+            self._dict_project_cache.invalidate(pid)
 
     def _list_dict_projects(self) -> list[dict[str, Any]]:
+        cached_projects = self._dict_projects_cache.get(None)
+        if cached_projects is not None:
+            return cached_projects
         dict_projects: list[dict[str, Any]] = self.client._post("projects")
+        self._dict_projects_cache.set(None, dict_projects)
         return dict_projects
 
     def _get_dict_project_by_pid(self, pid: str) -> dict[str, Any]:
+        cached_project = self._dict_project_cache.get(pid)
+        if cached_project is not None:
+            return cached_project
         dict_project: dict[str, Any] = self.client._post("project/data", {"pid": pid})
+        self._dict_project_cache.set(pid, dict_project)
         return dict_project
 
+    def iter_projects(self) -> Iterator[Project]:
+        """Like :meth:`list_projects`, but creates the :class:`Project` objects
+        one at a time as the iterator is consumed.
+        """
+        for dict_project in self._list_dict_projects():
+            yield Project.from_dict(client=self.client, dict_project=dict_project)
+
     def list_projects(self) -> list[Project]:
-        dict_projects = self._list_dict_projects()
-        projects: list[Project] = []
-        for dict_project in dict_projects:
-            projects.append(
-                Project.from_dict(client=self.client, dict_project=dict_project)
-            )
-        return projects
+        return [
+            Project.from_dict(client=self.client, dict_project=dict_project)
+            for dict_project in self._list_dict_projects()
+        ]
+
+    def _get_projects_by_pids(self, pids: list[str]) -> list[Project]:
+        # The access level is read from project/data like in get_project_by_pid(),
+        # the projects listing may report another level, e.g. for a sysadmin
+        # that isn't a member. The projects are fetched concurrently.
+        dict_projects = self.client._map(self._get_dict_project_by_pid, pids)
+        return [
+            Project.from_dict(client=self.client, dict_project=dict_project)
+            for dict_project in dict_projects
+        ]
 
     def get_project_by_pid(self, pid: str) -> Project:
         dict_project = self._get_dict_project_by_pid(pid)
         return Project.from_dict(client=self.client, dict_project=dict_project)
 
     def get_project_by_name(self, name: str) -> Project:
-        projects = self.list_projects()
-        for project in projects:
+        # Exact matches take precedence over case-insensitive matches
+        lower_name = name.lower()
+        fallback: Optional[Project] = None
+        for project in self.iter_projects():
             if project.name == name:
                 return project
-        for project in projects:
-            if project.name.lower() == name.lower():
-                return project
+            if fallback is None and project.name.lower() == lower_name:
+                fallback = project
+        if fallback is not None:
+            return fallback
         raise ValueError(f"Invalid project {name}")
 
     def create_project(
@@ -256,4 +348,7 @@ class Projects:
         if organization is not None:
             data["organization"] = organization.tag
         dict_project = self.client._put("project", data)
+        self._invalidate(dict_project["pid"])
+        if organization is not None:
+            self.client.organizations._invalidate(organization.tag)
         return self.get_project_by_pid(dict_project["pid"])
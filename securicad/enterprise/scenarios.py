@@ -14,10 +14,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import logging
+import weakref
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
+from securicad.enterprise.cache import K, TTLCache, V
 from securicad.enterprise.deprecation import deprecated
 from securicad.enterprise.simulations import Simulation
+from securicad.enterprise.tunings import _get_tuning_ids
 
 if TYPE_CHECKING:
     from securicad.model import Model
@@ -27,8 +32,21 @@ if TYPE_CHECKING:
     from securicad.enterprise.projects import Project
     from securicad.enterprise.tunings import Tuning
 
+logger = logging.getLogger(__name__)
+
 
 class Scenario:
+    __slots__ = (
+        "client",
+        "pid",
+        "tid",
+        "_name",
+        "_name_casefold",
+        "description",
+        "_simulations_future",
+        "__weakref__",
+    )
+
     def __init__(
         self, client: Client, pid: str, tid: str, name: str, description: str
     ) -> None:
@@ -37,6 +55,17 @@ class Scenario:
         self.tid = tid
         self.name = name
         self.description = description
+        self._simulations_future: Optional[Future[list[Simulation]]] = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        # Kept for case-insensitive lookups by name
+        self._name = name
+        self._name_casefold = name.casefold()
 
     @staticmethod
     def from_dict(client: Client, dict_scenario: dict[str, Any]) -> Scenario:
@@ -58,16 +87,38 @@ class Scenario:
             "description": self.description if description is None else description,
         }
         response = self.client._post("scenario", data)
+        self.client.scenarios._invalidate(self.pid, self.tid)
         self.name = response["name"]
         self.description = response["description"]
 
     def delete(self) -> None:
         data: dict[str, Any] = {"pid": self.pid, "tids": [self.tid]}
         self.client._delete("scenarios", data)
+        self.client.scenarios._invalidate(self.pid, self.tid)
+
+    def _prefetch_simulations(self) -> None:
+        if self.client._prefetch:
+            self._simulations_future = self.client._submit(
+                self.client.simulations._list_simulations, self
+            )
+            self.client.scenarios._prefetched.add(self)
+
+    def _discard_prefetched_simulations(self) -> None:
+        self._simulations_future = None
+        self.client.scenarios._prefetched.discard(self)
 
     def list_simulations(self) -> list[Simulation]:
+        # A prefetched list is only used once, later calls fetch a fresh one
+        future = self._simulations_future
+        if future is not None:
+            self._discard_prefetched_simulations()
+            return future.result()
         return self.client.simulations._list_simulations(scenario=self)
 
+    async def alist_simulations(self) -> list[Simulation]:
+        """Asynchronous version of :meth:`list_simulations`."""
+        return await self.client._run_async(self.list_simulations)
+
     def get_simulation_by_simid(self, simid: str) -> Simulation:
         return self.client.simulations._get_simulation_by_simid(
             scenario=self, simid=simid
@@ -97,52 +148,121 @@ class Scenario:
 class Scenarios:
     def __init__(self, client: Client) -> None:
         self.client = client
+        # Expired entries are served for another cache_stale seconds while they
+        # are refreshed in the background
+        self._dict_scenarios_cache: TTLCache[str, dict[str, dict[str, Any]]] = TTLCache(
+            client._cache_ttl, stale=client._cache_stale
+        )
+        self._dict_scenario_cache: TTLCache[tuple[str, str], dict[str, Any]] = TTLCache(
+            client._cache_ttl, stale=client._cache_stale
+        )
+        # Scenarios with simulations fetched in the background, which are
+        # discarded when the scenario is invalidated
+        self._prefetched: weakref.WeakSet[Scenario] = weakref.WeakSet()
+
+    def _invalidate(self, pid: Optional[str] = None, tid: Optional[str] = None) -> None:
+        for scenario in list(self._prefetched):
+            if pid is None or (
+                scenario.pid == pid and (tid is None or scenario.tid == tid)
+            ):
+                scenario._discard_prefetched_simulations()
+        # Invalidated entries are not stored by refreshes that already began
+        if pid is None:
+            self._dict_scenarios_cache.clear()
+        else:
+            self._dict_scenarios_cache.invalidate(pid)
+        if pid is None or tid is None:
+            self._dict_scenario_cache.clear()
+        else:
+            self._dict_scenario_cache.invalidate((pid, tid))
+
+    def __get_cached(self, cache: TTLCache[K, V], key: K, fetch: Callable[[], V]) -> V:
+        entry = cache.get_stale(key)
+        # The entry is fetched again if there is no executor to refresh it with,
+        # e.g. after close()
+        if entry is None or (entry[1] and self.client._executor is None):
+            value = fetch()
+            cache.set(key, value)
+            return value
+        value, expired = entry
+        if expired:
+            token = cache.begin_refresh(key)
+            if token is not None:
+                self.client._submit(self.__refresh, cache, key, fetch, token)
+        return value
+
+    @staticmethod
+    def __refresh(
+        cache: TTLCache[K, V], key: K, fetch: Callable[[], V], token: object
+    ) -> None:
+        try:
+            value = fetch()
+        except Exception:  # pylint: disable=broad-except
+            # The stale entry expires and the next lookup fetches it again
+            logger.warning("Failed to refresh cached scenario data", exc_info=True)
+            cache.end_refresh(key, token)
+        else:
+            cache.end_refresh(key, token, value)
 
     def _list_dict_scenarios(self, pid: str) -> dict[str, dict[str, Any]]:
-        dict_scenarios: dict[str, dict[str, Any]] = self.client._post(
-            "scenarios", {"pid": pid}
-        )
-        return dict_scenarios
+        def fetch() -> dict[str, dict[str, Any]]:
+            dict_scenarios: dict[str, dict[str, Any]] = self.client._post(
+                "scenarios", {"pid": pid}
+            )
+            return dict_scenarios
+
+        return self.__get_cached(self._dict_scenarios_cache, pid, fetch)
 
     def _get_dict_scenario_by_tid(self, pid: str, tid: str) -> dict[str, Any]:
-        data: dict[str, Any] = {"pid": pid, "tid": tid}
-        dict_scenario: dict[str, Any] = self.client._post("scenario/data", data)
-        return dict_scenario
+        def fetch() -> dict[str, Any]:
+            data: dict[str, Any] = {"pid": pid, "tid": tid}
+            dict_scenario: dict[str, Any] = self.client._post("scenario/data", data)
+            return dict_scenario
+
+        return self.__get_cached(self._dict_scenario_cache, (pid, tid), fetch)
 
     @deprecated("Use Project.list_scenarios()")
     def list_scenarios(self, project: Project) -> list[Scenario]:
-        return project.list_scenarios()
+        return self._list_scenarios(project=project)
 
     def _list_scenarios(self, project: Project) -> list[Scenario]:
         dict_scenarios = self._list_dict_scenarios(project.pid)
-        scenarios: list[Scenario] = []
-        for dict_scenario in dict_scenarios.values():
-            scenarios.append(
-                Scenario.from_dict(client=self.client, dict_scenario=dict_scenario)
-            )
-        return scenarios
+        return [
+            Scenario.from_dict(client=self.client, dict_scenario=dict_scenario)
+            for dict_scenario in dict_scenarios.values()
+        ]
 
     @deprecated("Use Project.get_scenario_by_tid()")
     def get_scenario_by_tid(self, project: Project, tid: str) -> Scenario:
-        return project.get_scenario_by_tid(tid=tid)
+        return self._get_scenario_by_tid(project=project, tid=tid)
 
     def _get_scenario_by_tid(self, project: Project, tid: str) -> Scenario:
         dict_scenario = self._get_dict_scenario_by_tid(project.pid, tid)
-        return Scenario.from_dict(client=self.client, dict_scenario=dict_scenario)
+        scenario = Scenario.from_dict(client=self.client, dict_scenario=dict_scenario)
+        scenario._prefetch_simulations()
+        return scenario
 
     @deprecated("Use Project.get_scenario_by_name()")
     def get_scenario_by_name(self, project: Project, name: str) -> Scenario:
-        return project.get_scenario_by_name(name=name)
+        return self._get_scenario_by_name(project=project, name=name)
 
     def _get_scenario_by_name(self, project: Project, name: str) -> Scenario:
-        scenarios = project.list_scenarios()
-        for scenario in scenarios:
+        # Exact matches take precedence over case-insensitive matches
+        casefold_name = name.casefold()
+        match: Optional[Scenario] = None
+        fallback: Optional[Scenario] = None
+        for scenario in project.list_scenarios():
             if scenario.name == name:
-                return scenario
-        for scenario in scenarios:
-            if scenario.name.lower() == name.lower():
-                return scenario
-        raise ValueError(f"Invalid scenario {name}")
+                match = scenario
+                break
+            if fallback is None and scenario._name_casefold == casefold_name:
+                fallback = scenario
+        if match is None:
+            match = fallback
+        if match is None:
+            raise ValueError(f"Invalid scenario {name}")
+        match._prefetch_simulations()
+        return match
 
     @deprecated("Use Project.create_scenario()")
     def create_scenario(
@@ -155,7 +275,8 @@ class Scenarios:
         raw_tunings: Optional[list[dict[str, Any]]] = None,
         filter_results: bool = True,
     ) -> Scenario:
-        return project.create_scenario(
+        return self._create_scenario(
+            project=project,
             model_info=model_info,
             name=name,
             description=description,
@@ -182,8 +303,9 @@ class Scenarios:
             "filter_results": filter_results,
         }
         if tunings is not None:
-            data["cids"] = [t.tuning_id for t in tunings]
+            data["cids"] = _get_tuning_ids(tunings)
         if raw_tunings is not None:
             data["tunings"] = raw_tunings
         dict_scenario = self.client._put("scenario", data)
+        self._invalidate(project.pid, dict_scenario["tid"])
         return Scenario.from_dict(client=self.client, dict_scenario=dict_scenario)
@@ -14,14 +14,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Optional
-from urllib.parse import urljoin
-
-from securicad.model import es_serializer
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 
 from securicad.enterprise.deprecation import deprecated
-from securicad.enterprise.exceptions import StatusCodeException
+from securicad.enterprise.exceptions import (
+    SimulationFailedException,
+    StatusCodeException,
+)
+from securicad.enterprise.tunings import _get_tuning_ids
 
 if TYPE_CHECKING:
     from securicad.model import Model
@@ -30,8 +35,43 @@ if TYPE_CHECKING:
     from securicad.enterprise.scenarios import Scenario
     from securicad.enterprise.tunings import Tuning
 
+# Bounds in seconds for the delay between progress polls
+POLL_INITIAL = 0.1
+POLL_MAX = 10.0
+
+
+def _get_pending(simulations: Iterable[Simulation]) -> list[Simulation]:
+    # Finished simulations have a progress of 100 and failed ones a negative
+    return [simulation for simulation in simulations if 0 <= simulation.progress < 100]
+
+
+def _get_sleep(delay: float) -> float:
+    return delay + random.uniform(0, delay * 0.1)
+
+
+def _get_next_delay(delay: float, advanced: bool) -> float:
+    # Short simulations are polled quickly and stalled ones less and less
+    # often, the delay shrinks again while the progress keeps advancing
+    if advanced:
+        return max(delay / 2, POLL_INITIAL)
+    return min(delay * 2, POLL_MAX)
+
 
 class Simulation:
+    __slots__ = (
+        "client",
+        "pid",
+        "tid",
+        "simid",
+        "_name",
+        "_name_casefold",
+        "progress",
+        "result",
+        "raw_result",
+        "_attackpaths",
+        "_report_url",
+    )
+
     def __init__(
         self, client: Client, pid: str, tid: str, simid: str, name: str, progress: int
     ) -> None:
@@ -42,6 +82,23 @@ class Simulation:
         self.name = name
         self.progress = progress
         self.result: Optional[dict[str, Any]] = None
+        self.raw_result: Optional[str] = None
+        # Attack paths by hva, None when there is no attack path
+        self._attackpaths: dict[str, Optional[dict[str, Any]]] = {}
+        # The base URL always ends with a slash
+        self._report_url = (
+            f"{client._base_url}project/{pid}/scenario/{tid}/report/{simid}"
+        )
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        # Compared against by Simulations._get_simulation_by_name()
+        self._name = name
+        self._name_casefold = name.casefold()
 
     @staticmethod
     def from_dict(client: Client, dict_simulation: dict[str, Any]) -> Simulation:
@@ -54,51 +111,133 @@ class Simulation:
             progress=dict_simulation["progress"],
         )
 
-    def __update_progress(self) -> None:
-        dict_simulation = self.client.simulations._get_dict_simulation_by_simid(
-            self.pid, self.simid
-        )
-        self.progress = dict_simulation["progress"]
-
     def __wait_for_results(self) -> None:
-        if self.progress == 100:
-            return
-        while True:
-            self.__update_progress()
-            if self.progress < 0 or self.progress == 100:  # failed or finished
-                break
-            time.sleep(1)
+        self.client.simulations._wait_for_simulations([self])
+        if self.progress < 0:
+            raise SimulationFailedException(self.simid, self.name)
+
+    async def __await_results(self) -> None:
+        await self.client.simulations._await_simulations([self])
+        if self.progress < 0:
+            raise SimulationFailedException(self.simid, self.name)
 
     def delete(self) -> None:
         data: dict[str, Any] = {"pid": self.pid, "simids": [self.simid]}
         self.client._delete("simulations", data)
+        self.client.scenarios._invalidate(self.pid, self.tid)
+        self.invalidate_results()
+
+    def invalidate_results(self) -> None:
+        """Discards the results stored by get_results() and get_raw_results()."""
+        self.result = None
+        self.raw_result = None
+        self._attackpaths = {}
+
+    def get_results(self, refresh: bool = False) -> dict[str, Any]:
+        """Waits for the simulation to finish and returns its results.
+
+        The results are fetched once and then reused by later calls.
+        :class:`SimulationFailedException` is raised if the simulation failed.
 
-    def get_results(self) -> dict[str, Any]:
+        :param refresh: (optional) Whether to fetch the results again.
+        :return: The results of the simulation.
+        """
+        if self.result is not None and not refresh:
+            return self.result
         self.__wait_for_results()
         data: dict[str, Any] = {"pid": self.pid, "simid": self.simid}
         result: dict[str, Any] = self.client._post("simulation/data", data)
-        result["report_url"] = urljoin(
-            self.client._base_url,
-            f"project/{self.pid}/scenario/{self.tid}/report/{self.simid}",
-        )
+        result["report_url"] = self._report_url
         self.result = result
         return result
 
-    def get_raw_results(self) -> str:
+    async def aget_results(self, refresh: bool = False) -> dict[str, Any]:
+        """Asynchronous version of :meth:`get_results`."""
+        if self.result is not None and not refresh:
+            return self.result
+        # Waiting sleeps on the event loop, only the requests use threads
+        await self.__await_results()
+        return await self.client._run_async(self.get_results, refresh)
+
+    def get_raw_results(self, refresh: bool = False) -> str:
+        """Waits for the simulation to finish and returns its raw results.
+
+        The raw results are fetched once and then reused by later calls.
+
+        :param refresh: (optional) Whether to fetch the raw results again.
+        :return: The raw results of the simulation in CSV format.
+        :raises ValueError: If the raw results have fewer than four lines.
+        """
+
         def cleanup(result: str) -> str:  # because of our not quite csv format
-            lines = result.split("\n")
-            if lines[2].startswith('"samplecount=') and lines[3].startswith('"build='):
-                return "\n".join(lines[4:])
+            # Find where the first four lines start, the CSV data is sliced off
+            # after them without splitting the header into separate strings
+            starts = [0]
+            for _ in range(4):
+                end = result.find("\n", starts[-1])
+                if end == -1:
+                    break
+                starts.append(end + 1)
+            if len(starts) < 4:
+                raise ValueError("Invalid raw results, expected at least 4 lines")
+            if result.startswith('"samplecount=', starts[2]) and result.startswith(
+                '"build=', starts[3]
+            ):
+                return result[starts[4] :] if len(starts) == 5 else ""
             return result
 
+        if self.raw_result is not None and not refresh:
+            return self.raw_result
         self.__wait_for_results()
         data: dict[str, Any] = {"pid": self.pid, "simid": self.simid}
         result = self.client._post("simulation/raw_data", data)
-        self.raw_result = cleanup(result["csv_data"])
-        return self.raw_result
+        raw_result = cleanup(result["csv_data"])
+        self.raw_result = raw_result
+        return raw_result
+
+    async def aget_raw_results(self, refresh: bool = False) -> str:
+        """Asynchronous version of :meth:`get_raw_results`."""
+        if self.raw_result is not None and not refresh:
+            return self.raw_result
+        await self.__await_results()
+        return await self.client._run_async(self.get_raw_results, refresh)
+
+    def iter_raw_results(self) -> Iterator[str]:
+        """Yields the lines of the raw results, without line breaks.
+
+        The server returns the raw results as a single string, the lines are
+        sliced out of it one at a time instead of being split into a list.
+        """
+        raw_result = self.get_raw_results()
+        start = 0
+        while start < len(raw_result):
+            end = raw_result.find("\n", start)
+            if end == -1:
+                end = len(raw_result)
+            yield raw_result[start:end]
+            start = end + 1
+
+    def __get_attackpath(self, hva: str) -> Optional[dict[str, Any]]:
+        if hva in self._attackpaths:
+            return self._attackpaths[hva]
+        attackpath: Optional[dict[str, Any]] = None
+        try:
+            data = {"simid": self.simid, "attackstep": hva}
+            resp = self.client._post("simulation/attackpath", data)
+            attackpath = resp["data"]
+        except StatusCodeException as ex:
+            if (
+                ex.status_code != 500
+                or ex.json is None
+                or ex.json.get("error") != "no attackpath found"
+            ):
+                raise
+        # The attack paths of a finished simulation never change
+        self._attackpaths[hva] = attackpath
+        return attackpath
 
     def get_critical_paths(
-        self, hvas: Optional[list[str]] = None
+        self, hvas: Optional[list[str]] = None, refresh: bool = False
     ) -> dict[str, dict[str, Any]]:
         """
         Returns some or all critial paths for this simulation.
@@ -106,65 +245,176 @@ class Simulation:
         Parameters:
             hvas: A list of strings on the form "<object_id>.<attackstep>", e.g. "1.Compromise".
                   If hvas is None all critical paths are returned.
+            refresh: Whether to fetch the results and critical paths again instead
+                     of reusing the ones fetched by earlier calls.
 
         Returns:
             A dict of the form data["1.Compromise"] = { critical path }
         """
-        if not self.result:
-            self.get_results()
+        result = self.get_results(refresh)
+        if refresh:
+            self._attackpaths = {}
+        if hvas is None:
+            hvas = [risk["attackstep_id"] for risk in result["results"]["risks"]]
+
+        # The attack paths are fetched concurrently, in the order of hvas
+        attackpaths: dict[str, dict[str, Any]] = {}
+        for hva, attackpath in zip(hvas, self.client._map(self.__get_attackpath, hvas)):
+            if attackpath is not None:
+                attackpaths[hva] = attackpath
+        return attackpaths
 
+    async def aget_critical_paths(
+        self, hvas: Optional[list[str]] = None, refresh: bool = False
+    ) -> dict[str, dict[str, Any]]:
+        """Asynchronous version of :meth:`get_critical_paths`."""
+        result = await self.aget_results(refresh)
+        if refresh:
+            self._attackpaths = {}
         if hvas is None:
-            if not self.result:
-                raise ValueError(
-                    "No result stored, unable to retrieve high value assets, please specify"
-                )
-            hvas = []
-            for risk in self.result["results"]["risks"]:
-                hvas.append(risk["attackstep_id"])
+            hvas = [risk["attackstep_id"] for risk in result["results"]["risks"]]
+
+        # Like _map(), at most parallelism attack paths are fetched at once
+        semaphore = asyncio.Semaphore(max(self.client._parallelism, 1))
+
+        async def get_attackpath(hva: str) -> Optional[dict[str, Any]]:
+            async with semaphore:
+                return await self.client._run_async(self.__get_attackpath, hva)
 
+        found = await asyncio.gather(*(get_attackpath(hva) for hva in hvas))
         attackpaths: dict[str, dict[str, Any]] = {}
-        for hva in hvas:
-            try:
-                data = {"simid": self.simid, "attackstep": hva}
-                resp = self.client._post("simulation/attackpath", data)
-                attackpaths[hva] = resp["data"]
-            except StatusCodeException as ex:
-                if (
-                    ex.status_code != 500
-                    or ex.json is None
-                    or ex.json.get("error") != "no attackpath found"
-                ):
-                    raise
+        for hva, attackpath in zip(hvas, found):
+            if attackpath is not None:
+                attackpaths[hva] = attackpath
         return attackpaths
 
 
 class Simulations:
     def __init__(self, client: Client) -> None:
         self.client = client
+        # Identical concurrent progress polls share one in-flight request
+        self._inflight: dict[tuple[str, tuple[str, ...]], Future[Any]] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _get_dict_simulations_by_simids(
+        self, pid: str, simids: Iterable[str]
+    ) -> dict[str, dict[str, Any]]:
+        simids = tuple(simids)
+        key = (pid, simids)
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                future: Future[Any] = Future()
+                self._inflight[key] = future
+        if pending is not None:
+            dict_simulations: dict[str, dict[str, Any]] = pending.result()
+            return dict_simulations
+        try:
+            data: dict[str, Any] = {"pid": pid, "simids": list(simids)}
+            dict_simulations = self.client._post("simulations/data", data)
+            future.set_result(dict_simulations)
+            return dict_simulations
+        except BaseException as ex:
+            future.set_exception(ex)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
     def _get_dict_simulation_by_simid(self, pid: str, simid: str) -> dict[str, Any]:
-        data: dict[str, Any] = {"pid": pid, "simids": [simid]}
-        dict_simulation: dict[str, Any] = self.client._post("simulations/data", data)[
-            simid
-        ]
-        return dict_simulation
+        return self._get_dict_simulations_by_simids(pid, [simid])[simid]
+
+    def __get_polls(
+        self, pending: list[Simulation]
+    ) -> list[tuple[str, tuple[str, ...], list[Simulation]]]:
+        # One request per project polls all of its pending simulations
+        simulations_by_pid: dict[str, list[Simulation]] = {}
+        for simulation in pending:
+            simulations_by_pid.setdefault(simulation.pid, []).append(simulation)
+        polls: list[tuple[str, tuple[str, ...], list[Simulation]]] = []
+        for pid, pid_simulations in simulations_by_pid.items():
+            simids = tuple(simulation.simid for simulation in pid_simulations)
+            polls.append((pid, simids, pid_simulations))
+        return polls
+
+    def __poll(
+        self, polls: list[tuple[str, tuple[str, ...], list[Simulation]]]
+    ) -> bool:
+        """Updates the progress of the polled simulations.
+
+        :return: Whether the progress of any simulation advanced.
+        """
+        advanced = False
+        for pid, simids, pid_simulations in polls:
+            dict_simulations = self._get_dict_simulations_by_simids(pid, simids)
+            for simulation in pid_simulations:
+                progress = dict_simulations[simulation.simid]["progress"]
+                if progress > simulation.progress:
+                    advanced = True
+                simulation.progress = progress
+        return advanced
+
+    def _wait_for_simulations(self, simulations: Iterable[Simulation]) -> None:
+        pending = _get_pending(simulations)
+        # The polls are only rebuilt when a simulation has finished or failed
+        polls = self.__get_polls(pending)
+        delay = POLL_INITIAL
+        while pending:
+            advanced = self.__poll(polls)
+            still_pending = _get_pending(pending)
+            if not still_pending:
+                break
+            if len(still_pending) != len(pending):
+                pending = still_pending
+                polls = self.__get_polls(pending)
+            time.sleep(_get_sleep(delay))
+            delay = _get_next_delay(delay, advanced)
+
+    async def _await_simulations(self, simulations: Iterable[Simulation]) -> None:
+        pending = _get_pending(simulations)
+        polls = self.__get_polls(pending)
+        delay = POLL_INITIAL
+        while pending:
+            advanced = await self.client._run_async(self.__poll, polls)
+            still_pending = _get_pending(pending)
+            if not still_pending:
+                break
+            if len(still_pending) != len(pending):
+                pending = still_pending
+                polls = self.__get_polls(pending)
+            await asyncio.sleep(_get_sleep(delay))
+            delay = _get_next_delay(delay, advanced)
+
+    def wait_for_simulations(self, simulations: Iterable[Simulation]) -> None:
+        """Waits until all simulations have either finished or failed.
+
+        Failed simulations are not raised for, they are left with a negative
+        ``progress``.
+
+        :param simulations: The :class:`Simulation` objects to wait for.
+        """
+        self._wait_for_simulations(simulations)
+
+    async def await_for_simulations(self, simulations: Iterable[Simulation]) -> None:
+        """Asynchronous version of :meth:`wait_for_simulations`.
+
+        Any number of simulations can be waited for on one event loop, the
+        delays between polls don't hold a thread.
+        """
+        await self._await_simulations(simulations)
 
     def _list_simulations(self, scenario: Scenario) -> list[Simulation]:
         dict_scenario = self.client.scenarios._get_dict_scenario_by_tid(
             scenario.pid, scenario.tid
         )
-        simulations: list[Simulation] = []
-        for dict_simulation in dict_scenario["results"].values():
-            simulations.append(
-                Simulation.from_dict(
-                    client=self.client, dict_simulation=dict_simulation
-                )
-            )
-        return simulations
+        return [
+            Simulation.from_dict(client=self.client, dict_simulation=dict_simulation)
+            for dict_simulation in dict_scenario["results"].values()
+        ]
 
     @deprecated("Use Scenario.list_simulations()")
     def list_simulations(self, scenario: Scenario) -> list[Simulation]:
-        return scenario.list_simulations()
+        return self._list_simulations(scenario=scenario)
 
     def _get_simulation_by_simid(self, scenario: Scenario, simid: str) -> Simulation:
         dict_simulation = self._get_dict_simulation_by_simid(scenario.pid, simid)
@@ -172,21 +422,24 @@ class Simulations:
 
     @deprecated("Use Scenario.get_simulation_by_simid()")
     def get_simulation_by_simid(self, scenario: Scenario, simid: str) -> Simulation:
-        return scenario.get_simulation_by_simid(simid=simid)
+        return self._get_simulation_by_simid(scenario=scenario, simid=simid)
 
     def _get_simulation_by_name(self, scenario: Scenario, name: str) -> Simulation:
-        simulations = scenario.list_simulations()
-        for simulation in simulations:
+        # Exact matches take precedence over case-insensitive matches
+        casefold_name = name.casefold()
+        fallback: Optional[Simulation] = None
+        for simulation in scenario.list_simulations():
             if simulation.name == name:
                 return simulation
-        for simulation in simulations:
-            if simulation.name.lower() == name.lower():
-                return simulation
+            if fallback is None and simulation._name_casefold == casefold_name:
+                fallback = simulation
+        if fallback is not None:
+            return fallback
         raise ValueError(f"Invalid simulation {name}")
 
     @deprecated("Use Scenario.get_simulation_by_name()")
     def get_simulation_by_name(self, scenario: Scenario, name: str) -> Simulation:
-        return scenario.get_simulation_by_name(name=name)
+        return self._get_simulation_by_name(scenario=scenario, name=name)
 
     def _create_simulation(
         self,
@@ -205,12 +458,17 @@ class Simulations:
         if name is not None:
             data["name"] = name
         if model is not None:
+            # securicad.model is only imported once a model is simulated
+            # pylint: disable=import-outside-toplevel
+            from securicad.model import es_serializer
+
             data["blob"] = es_serializer.serialize_model(model)
         if tunings is not None:
-            data["cids"] = [t.tuning_id for t in tunings]
+            data["cids"] = _get_tuning_ids(tunings)
         if raw_tunings is not None:
             data["tunings"] = raw_tunings
         response = self.client._put("simulation", data)
+        self.client.scenarios._invalidate(scenario.pid, scenario.tid)
         return self._get_simulation_by_simid(scenario, response["simid"])
 
     @deprecated("Use Scenario.create_simulation()")
@@ -223,7 +481,8 @@ class Simulations:
         raw_tunings: Optional[list[dict[str, Any]]] = None,
         filter_results: bool = True,
     ) -> Simulation:
-        return scenario.create_simulation(
+        return self._create_simulation(
+            scenario=scenario,
             name=name,
             model=model,
             tunings=tunings,
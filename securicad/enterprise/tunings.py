@@ -14,7 +14,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import operator
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
 from securicad.enterprise.deprecation import deprecated
 
@@ -22,8 +23,31 @@ if TYPE_CHECKING:
     from securicad.enterprise.client import Client
     from securicad.enterprise.projects import Project
 
+_get_tuning_id = operator.attrgetter("tuning_id")
+
+
+def _get_tuning_ids(tunings: Iterable[Tuning]) -> list[str]:
+    return list(map(_get_tuning_id, tunings))
+
 
 class Tuning:
+    __slots__ = (
+        "client",
+        "project",
+        "tuning_id",
+        "tuning_type",
+        "op",
+        "filter_metaconcept",
+        "filter_object_name",
+        "filter_attackstep",
+        "filter_defense",
+        "filter_tags",
+        "tags",
+        "ttc",
+        "probability",
+        "consequence",
+    )
+
     def __init__(
         self,
         client: Client,
@@ -60,21 +84,30 @@ class Tuning:
     def from_dict(
         client: Client, project: Project, dict_tuning: dict[str, Any]
     ) -> Tuning:
+        return Tuning._from_config(
+            client, project, dict_tuning["cid"], dict_tuning["config"]
+        )
+
+    @staticmethod
+    def _from_config(
+        client: Client, project: Project, tuning_id: str, config: dict[str, Any]
+    ) -> Tuning:
+        config_filter = config["filter"]
         return Tuning(
             client=client,
             project=project,
-            tuning_id=dict_tuning["cid"],
-            tuning_type=dict_tuning["config"]["type"],
-            op=dict_tuning["config"]["op"],
-            filter_metaconcept=dict_tuning["config"]["filter"].get("metaconcept"),
-            filter_object_name=dict_tuning["config"]["filter"].get("object_name"),
-            filter_attackstep=dict_tuning["config"]["filter"].get("attackstep"),
-            filter_defense=dict_tuning["config"]["filter"].get("defense"),
-            filter_tags=dict_tuning["config"]["filter"].get("tags"),
-            tags=dict_tuning["config"].get("tags"),
-            ttc=dict_tuning["config"].get("ttc"),
-            probability=dict_tuning["config"].get("probability"),
-            consequence=dict_tuning["config"].get("consequence"),
+            tuning_id=tuning_id,
+            tuning_type=config["type"],
+            op=config["op"],
+            filter_metaconcept=config_filter.get("metaconcept"),
+            filter_object_name=config_filter.get("object_name"),
+            filter_attackstep=config_filter.get("attackstep"),
+            filter_defense=config_filter.get("defense"),
+            filter_tags=config_filter.get("tags"),
+            tags=config.get("tags"),
+            ttc=config.get("ttc"),
+            probability=config.get("probability"),
+            consequence=config.get("consequence"),
         )
 
     def delete(self) -> None:
@@ -89,20 +122,15 @@ class Tunings:
 
     @deprecated("Use Project.list_tunings()")
     def list_tunings(self, project: Project) -> list[Tuning]:
-        return project.list_tunings()
+        return self._list_tunings(project=project)
 
     def _list_tunings(self, project: Project) -> list[Tuning]:
         dict_tunings = self.client._post("tunings", {"pid": project.pid})
-        retr: list[Tuning] = []
-        for tuning_id, dict_tuning in dict_tunings["configs"].items():
-            retr.append(
-                Tuning.from_dict(
-                    self.client,
-                    project,
-                    {"pid": project.pid, "cid": tuning_id, "config": dict_tuning},
-                )
-            )
-        return retr
+        # The listing maps tuning ids to configs, which are read as they are
+        return [
+            Tuning._from_config(self.client, project, tuning_id, config)
+            for tuning_id, config in dict_tunings["configs"].items()
+        ]
 
     @deprecated("Use Project.create_tuning()")
     def create_tuning(
@@ -116,7 +144,8 @@ class Tunings:
         probability: Optional[float] = None,
         consequence: Optional[int] = None,
     ) -> Tuning:
-        return project.create_tuning(
+        return self._create_tuning(
+            project=project,
             tuning_type=tuning_type,
             filterdict=filterdict,
             op=op,
@@ -126,9 +155,8 @@ class Tunings:
             consequence=consequence,
         )
 
-    def _create_tuning(
-        self,
-        project: Project,
+    @staticmethod
+    def __get_tuning(
         tuning_type: str,
         filterdict: dict[str, Any],
         op: str = "apply",
@@ -136,29 +164,63 @@ class Tunings:
         ttc: Optional[str] = None,
         probability: Optional[float] = None,
         consequence: Optional[int] = None,
-    ) -> Tuning:
-        def get_tuning() -> dict[str, Any]:
-            tuning: dict[str, Any] = {
-                "type": tuning_type,
-                "op": op,
-                "filter": filterdict,
-            }
-            if tuning_type == "tag" and op == "apply":
-                tuning["tags"] = tags
-            elif tuning_type == "ttc" and op == "apply":
-                tuning["ttc"] = ttc
-            elif tuning_type == "probability" and op == "apply":
-                tuning["probability"] = probability
-            elif tuning_type == "consequence" and op == "apply":
-                tuning["consequence"] = consequence
-            return tuning
-
+    ) -> dict[str, Any]:
         if tuning_type not in ["attacker", "tag", "ttc", "probability", "consequence"]:
             raise ValueError(f"Unknown tuning_type {tuning_type}")
         if op not in ["apply", "clear"]:
             raise ValueError(f"Unknown op {op}")
-        data = {"pid": project.pid, "tunings": [get_tuning()]}
+        tuning: dict[str, Any] = {
+            "type": tuning_type,
+            "op": op,
+            "filter": filterdict,
+        }
+        if tuning_type == "tag" and op == "apply":
+            tuning["tags"] = tags
+        elif tuning_type == "ttc" and op == "apply":
+            tuning["ttc"] = ttc
+        elif tuning_type == "probability" and op == "apply":
+            tuning["probability"] = probability
+        elif tuning_type == "consequence" and op == "apply":
+            tuning["consequence"] = consequence
+        return tuning
+
+    def _create_tuning(
+        self,
+        project: Project,
+        tuning_type: str,
+        filterdict: dict[str, Any],
+        op: str = "apply",
+        tags: Optional[dict[str, Any]] = None,
+        ttc: Optional[str] = None,
+        probability: Optional[float] = None,
+        consequence: Optional[int] = None,
+    ) -> Tuning:
+        tuning = self.__get_tuning(
+            tuning_type=tuning_type,
+            filterdict=filterdict,
+            op=op,
+            tags=tags,
+            ttc=ttc,
+            probability=probability,
+            consequence=consequence,
+        )
+        data = {"pid": project.pid, "tunings": [tuning]}
         dict_tuning = self.client._put("tunings", data)[0]
         return Tuning.from_dict(
             client=self.client, project=project, dict_tuning=dict_tuning
         )
+
+    def _create_tunings(
+        self, project: Project, tunings: list[dict[str, Any]]
+    ) -> list[Tuning]:
+        data = {
+            "pid": project.pid,
+            "tunings": [self.__get_tuning(**tuning) for tuning in tunings],
+        }
+        dict_tunings = self.client._put("tunings", data)
+        return [
+            Tuning.from_dict(
+                client=self.client, project=project, dict_tuning=dict_tuning
+            )
+            for dict_tuning in dict_tunings
+        ]
@@ -15,7 +15,9 @@
 from __future__ import annotations
 
 from enum import Enum, unique
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from securicad.enterprise.cache import TTLCache
 
 if TYPE_CHECKING:
     from securicad.enterprise.client import Client
@@ -31,13 +33,43 @@ class Role(Enum):
 
     @staticmethod
     def from_list(roles: list[str]) -> Role:
-        for role in Role:
-            if sorted(roles) == sorted(role.value):
-                return role
-        raise ValueError(f"Invalid role {roles}")
+        mask = 0
+        for name in roles:
+            bit = _ROLE_BITS.get(name)
+            # Repeated names don't match any role, like unknown ones
+            if bit is None or mask & bit:
+                raise ValueError(f"Invalid role {roles}")
+            mask |= bit
+        role = _ROLES_BY_MASK[mask]
+        if role is None:
+            raise ValueError(f"Invalid role {roles}")
+        return role
+
+
+# The order of the roles of a user is not significant
+_ROLE_SETS: dict[Role, frozenset[str]] = {role: frozenset(role.value) for role in Role}
+
+# Each combination of roles maps to a bitmask indexing the matching Role. Every
+# name used by any Role gets a bit, in the order the names first appear.
+_ROLE_NAMES = list(dict.fromkeys(name for role in Role for name in role.value))
+_ROLE_BITS: dict[str, int] = {name: 1 << i for i, name in enumerate(_ROLE_NAMES)}
+_ROLES_BY_MASK: list[Optional[Role]] = [None] * (1 << len(_ROLE_BITS))
+for _role in Role:
+    _ROLES_BY_MASK[sum(_ROLE_BITS[name] for name in _ROLE_SETS[_role])] = _role
+del _role
 
 
 class User:
+    __slots__ = (
+        "client",
+        "uid",
+        "username",
+        "firstname",
+        "lastname",
+        "role",
+        "organization",
+    )
+
     def __init__(
         self,
         client: Client,
@@ -85,34 +117,59 @@ class User:
         if password is not None:
             data["password"] = password
         dict_user = self.client._post("user", data)["user"]
+        self.client.users._invalidate()
+        self.client._whoami = None
         self.username = dict_user["email"]
         self.firstname = dict_user["firstname"]
         self.lastname = dict_user["lastname"]
 
     def delete(self) -> None:
         self.client._delete("user", {"uid": self.uid})
+        self.client.users._invalidate()
+        self.client._whoami = None
+        self.client.organizations._invalidate()
+        self.client.projects._invalidate()
 
     def set_role(self, role: Role) -> None:
-        to_add = [x for x in role.value if x not in self.role.value]
-        to_remove = [x for x in self.role.value if x not in role.value]
+        roles = _ROLE_SETS[role]
+        current_roles = _ROLE_SETS[self.role]
+        # Sorted to send the roles in a stable order
+        to_add = sorted(roles - current_roles)
+        to_remove = sorted(current_roles - roles)
         if to_add:
             self.client._put("user/roles", {"uid": self.uid, "roles": to_add})
         if to_remove:
             self.client._delete("user/roles", {"uid": self.uid, "roles": to_remove})
+        self.client.users._invalidate()
+        self.client._whoami = None
         self.role = role
 
 
 class Users:
     def __init__(self, client: Client) -> None:
         self.client = client
+        self._dict_users_cache: TTLCache[None, list[dict[str, Any]]] = TTLCache(
+            client._cache_ttl
+        )
+
+    def _invalidate(self) -> None:
+        self._dict_users_cache.clear()
 
     def _list_dict_users(self) -> list[dict[str, Any]]:
+        cached_users = self._dict_users_cache.get(None)
+        if cached_users is not None:
+            return cached_users
         dict_users: list[dict[str, Any]] = self.client._post("users")["users"]
+        self._dict_users_cache.set(None, dict_users)
         return dict_users
 
     def whoami(self) -> User:
-        dict_user = self.client._get("whoami")
-        dict_user["uid"] = dict_user["id"]
+        # A new User is returned each time, as User objects can be modified
+        dict_user = self.client._whoami
+        if dict_user is None:
+            dict_user = self.client._get("whoami")
+            dict_user["uid"] = dict_user["id"]
+            self.client._whoami = dict_user
         return User.from_dict(client=self.client, dict_user=dict_user)
 
     def change_password(self, old_password: str, new_password: str) -> None:
@@ -123,26 +180,48 @@ class Users:
         access_token = self.client._post("changepwd", data)["access_token"]
         self.client._set_access_token(access_token)
 
+    def iter_users(self) -> Iterator[User]:
+        """Like :meth:`list_users`, but creates the :class:`User` objects one at
+        a time as the iterator is consumed.
+        """
+        for dict_user in self._list_dict_users():
+            yield User.from_dict(client=self.client, dict_user=dict_user)
+
     def list_users(self) -> list[User]:
-        dict_users = self._list_dict_users()
-        users: list[User] = []
-        for dict_user in dict_users:
-            users.append(User.from_dict(client=self.client, dict_user=dict_user))
-        return users
+        return [
+            User.from_dict(client=self.client, dict_user=dict_user)
+            for dict_user in self._list_dict_users()
+        ]
 
     def get_user_by_uid(self, uid: int) -> User:
-        for user in self.list_users():
-            if user.uid == uid:
-                return user
+        # Only the matching user is turned into a User object
+        for dict_user in self._list_dict_users():
+            if dict_user["uid"] == uid:
+                return User.from_dict(client=self.client, dict_user=dict_user)
         raise ValueError(f"Invalid user {uid}")
 
+    def _get_users_by_uids(self, uids: list[int]) -> list[User]:
+        dict_users = {
+            dict_user["uid"]: dict_user for dict_user in self._list_dict_users()
+        }
+        users: list[User] = []
+        for uid in uids:
+            if uid not in dict_users:
+                raise ValueError(f"Invalid user {uid}")
+            users.append(User.from_dict(client=self.client, dict_user=dict_users[uid]))
+        return users
+
     def get_user_by_username(self, username: str) -> User:
-        for user in self.list_users():
-            if user.username == username:
-                return user
-        for user in self.list_users():
-            if user.username.lower() == username.lower():
-                return user
+        # Exact matches take precedence over case-insensitive matches
+        lower_username = username.lower()
+        fallback: Optional[dict[str, Any]] = None
+        for dict_user in self._list_dict_users():
+            if dict_user["email"] == username:
+                return User.from_dict(client=self.client, dict_user=dict_user)
+            if fallback is None and dict_user["email"].lower() == lower_username:
+                fallback = dict_user
+        if fallback is not None:
+            return User.from_dict(client=self.client, dict_user=fallback)
         raise ValueError(f"Invalid user {username}")
 
     def create_user(
@@ -165,4 +244,7 @@ class Users:
         if organization is not None:
             data["organization"] = organization.tag
         dict_user = self.client._put("user", data)
+        self._invalidate()
+        if organization is not None:
+            self.client.organizations._invalidate(organization.tag)
         return User.from_dict(client=self.client, dict_user=dict_user)
@@ -15,20 +15,57 @@
 from __future__ import annotations
 
 import io
-import json
-from typing import TYPE_CHECKING, Any, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from securicad.enterprise import codec
 
 if TYPE_CHECKING:
     from securicad.enterprise.client import Client
     from securicad.enterprise.models import ModelInfo
     from securicad.enterprise.projects import Project
 
+# The sub-parser and file name of each group of input files, in the order the
+# groups are passed to the generate_*_model functions
+_AWS_SUB_PARSERS = (
+    ("aws-cli-parser", "aws.json"),
+    ("aws-vul-parser", "vul.json"),
+)
+_AZURE_SUB_PARSERS = (
+    ("azure-active-directory-parser", "azure_ad.json"),
+    ("azure-application-insights-parser", "insights.json"),
+)
+
+
+def _get_file_io(file: dict[str, Any] | bytes | Path) -> io.BytesIO:
+    # Already serialized data is uploaded as is
+    if isinstance(file, bytes):
+        return io.BytesIO(file)
+    if isinstance(file, Path):
+        return io.BytesIO(file.read_bytes())
+    # The parser doesn't need pretty-printed JSON, compact JSON is smaller and
+    # faster to produce
+    return codec.dumps_io(file)
+
+
+def _get_files(
+    sub_parsers: tuple[tuple[str, str], ...],
+    file_groups: tuple[Optional[list[dict[str, Any] | bytes | Path]], ...],
+) -> Iterator[dict[str, Any]]:
+    # Files are serialized one at a time as the upload consumes them, so only
+    # one raw buffer is alive at once
+    for (sub_parser, name), files in zip(sub_parsers, file_groups):
+        if files is None:
+            continue
+        for file in files:
+            yield {"sub_parser": sub_parser, "name": name, "file": _get_file_io(file)}
+
 
 def generate_aws_model(
     project: Project,
     name: str,
-    cli_files: Optional[list[dict[str, Any]]] = None,
-    vul_files: Optional[list[dict[str, Any]]] = None,
+    cli_files: Optional[list[dict[str, Any] | bytes | Path]] = None,
+    vul_files: Optional[list[dict[str, Any] | bytes | Path]] = None,
 ) -> ModelInfo:
     """Generates a model from AWS data.
 
@@ -36,41 +73,24 @@ def generate_aws_model(
     :param name: The name of the generated model.
     :param cli_files: (optional) A list of CLI data created with ``securicad-aws-collector``.
     :param vul_files: (optional) A list of vulnerability data.
+
+    Each file can be given as a dict, as JSON encoded bytes, or as the
+    :class:`pathlib.Path` of a JSON file. Bytes and files are uploaded without
+    being parsed and serialized again.
+
     :return: A :class:`ModelInfo` object representing the generated model.
     """
-
-    def get_file_io(dict_file: dict[str, Any]) -> io.BytesIO:
-        file_str = json.dumps(dict_file, allow_nan=False, indent=2)
-        file_bytes = file_str.encode("utf-8")
-        return io.BytesIO(file_bytes)
-
-    def get_file(
-        sub_parser: str, name: str, dict_file: dict[str, Any]
-    ) -> dict[str, Any]:
-        return {
-            "sub_parser": sub_parser,
-            "name": name,
-            "file": get_file_io(dict_file),
-        }
-
-    def get_files() -> list[dict[str, Any]]:
-        files: list[dict[str, Any]] = []
-        if cli_files is not None:
-            for cli_file in cli_files:
-                files.append(get_file("aws-cli-parser", "aws.json", cli_file))
-        if vul_files is not None:
-            for vul_file in vul_files:
-                files.append(get_file("aws-vul-parser", "vul.json", vul_file))
-        return files
-
-    return project.generate_model(parser="aws-parser", name=name, files=get_files())
+    if not cli_files and not vul_files:
+        raise ValueError("No AWS files to generate a model from")
+    files = _get_files(_AWS_SUB_PARSERS, (cli_files, vul_files))
+    return project.generate_model(parser="aws-parser", name=name, files=files)
 
 
 def generate_azure_model(
     project: Project,
     name: str,
-    az_active_directory_files: Optional[list[dict[str, Any]]] = None,
-    application_insight_files: Optional[list[dict[str, Any]]] = None,
+    az_active_directory_files: Optional[list[dict[str, Any] | bytes | Path]] = None,
+    application_insight_files: Optional[list[dict[str, Any] | bytes | Path]] = None,
 ) -> ModelInfo:
     """Generates a model from Azure data.
 
@@ -78,39 +98,15 @@ def generate_azure_model(
     :param name: The name of the generated model.
     :param az_active_directory_files: (optional) A list of azure environment data created with ``securicad-azure-collector``.
     :param application_insight_files: (optional) A list of application insights data created with ``securicad-azure-collector``.
+
+    Each file can be given as a dict, as JSON encoded bytes, or as the
+    :class:`pathlib.Path` of a JSON file. Bytes and files are uploaded without
+    being parsed and serialized again.
+
     :return: A :class:`ModelInfo` object representing the generated model.
     """
-
-    def get_file_io(dict_file: dict[str, Any]) -> io.BytesIO:
-        file_str = json.dumps(dict_file, allow_nan=False, indent=2)
-        file_bytes = file_str.encode("utf-8")
-        return io.BytesIO(file_bytes)
-
-    def get_file(
-        sub_parser: str, name: str, dict_file: dict[str, Any]
-    ) -> dict[str, Any]:
-        return {
-            "sub_parser": sub_parser,
-            "name": name,
-            "file": get_file_io(dict_file),
-        }
-
-    def get_files() -> list[dict[str, Any]]:
-        files: list[dict[str, Any]] = []
-        if az_active_directory_files is not None:
-            for aad_file in az_active_directory_files:
-                files.append(
-                    get_file("azure-active-directory-parser", "azure_ad.json", aad_file)
-                )
-        if application_insight_files is not None:
-            for insight_file in application_insight_files:
-                files.append(
-                    get_file(
-                        "azure-application-insights-parser",
-                        "insights.json",
-                        insight_file,
-                    )
-                )
-        return files
-
-    return project.generate_model(parser="azure-parser", name=name, files=get_files())
+    if not az_active_directory_files and not application_insight_files:
+        raise ValueError("No Azure files to generate a model from")
+    file_groups = (az_active_directory_files, application_insight_files)
+    files = _get_files(_AZURE_SUB_PARSERS, file_groups)
+    return project.generate_model(parser="azure-parser", name=name, files=files)
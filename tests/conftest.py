@@ -12,21 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import io
 import json
 import sys
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import jsonschema
 import pytest
 
-# isort: off
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
-from securicad.enterprise import Role
-
-# isort: on
+# conftest.py is imported before the test modules and utils.py, so this is the
+# only place that has to make the SDK in the repository importable
+ROOT_PATH = str(Path(__file__).resolve().parent.parent)
+if ROOT_PATH not in sys.path:
+    sys.path.insert(0, ROOT_PATH)
 
 DATA: Dict[str, Dict[str, Any]] = {"users": {}, "organizations": {}}
 
@@ -37,31 +38,44 @@ ADMIN_PASSWORD: Optional[str] = None
 COMMON_PASSWORD: Optional[str] = None
 AWS_IMPORT_CONFIG: Optional[Dict[str, Any]] = None
 
-AWSLANG: Optional[List[Dict[str, Any]]] = None
-
 
-def get_config() -> Dict[str, Any]:
-    schema_path = Path(__file__).with_name("config.schema.json")
+# The JSON files are only read and validated once per session
+@functools.lru_cache(maxsize=None)
+def get_validator(schema_name: str) -> Any:
+    schema_path = Path(__file__).with_name(schema_name)
     with schema_path.open(mode="r", encoding="utf-8") as f:
         schema = json.load(f)
+    # The validator checks the schema and prepares it once, instead of on
+    # every jsonschema.validate() call
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+@functools.lru_cache(maxsize=None)
+def get_config() -> Dict[str, Any]:
     config_path = Path(__file__).with_name("config.json")
     with config_path.open(mode="r", encoding="utf-8") as f:
         config = json.load(f)
-    jsonschema.validate(instance=config, schema=schema)
+    get_validator("config.schema.json").validate(config)
     return config
 
 
+@functools.lru_cache(maxsize=None)
 def get_data() -> Dict[str, Any]:
-    schema_path = Path(__file__).with_name("data.schema.json")
-    with schema_path.open(mode="r", encoding="utf-8") as f:
-        schema = json.load(f)
     data_path = Path(__file__).with_name("data.json")
     with data_path.open(mode="r", encoding="utf-8") as f:
         data = json.load(f)
-    jsonschema.validate(instance=data, schema=schema)
+    get_validator("data.schema.json").validate(data)
     return data
 
 
+@functools.lru_cache(maxsize=None)
+def get_model_bytes(name: str) -> bytes:
+    return Path(__file__).with_name(name).read_bytes()
+
+
+@functools.lru_cache(maxsize=None)
 def get_awslang() -> List[Dict[str, Any]]:
     awslang_path = Path(__file__).with_name("awslang.json")
     with awslang_path.open(mode="r", encoding="utf-8") as f:
@@ -92,6 +106,9 @@ def read_config() -> None:
 
 
 def read_data() -> None:
+    # pylint: disable=import-outside-toplevel
+    from securicad.enterprise import Role
+
     def get_user(user: Dict[str, Any]) -> Dict[str, Any]:
         if user["password"] is None:
             password = COMMON_PASSWORD
@@ -130,7 +147,9 @@ def read_data() -> None:
         "role": Role.SYSADMIN,
     }
     for user in data["users"]:
-        DATA["users"][user["username"]] = get_user(user)
+        # The sysadmin from config.json is only listed once
+        if user["username"] != ADMIN_USERNAME:
+            DATA["users"][user["username"]] = get_user(user)
     for org in data["organizations"]:
         DATA["organizations"][org["name"]] = get_org(org)
 
@@ -140,63 +159,91 @@ def create_data() -> None:
 
     client = utils.get_client_sysadmin()
 
+    def delete(obj: Any) -> None:
+        obj.delete()
+
+    def create_user(user_data: Dict[str, Any], org: Any = None) -> None:
+        user = client.users.create_user(
+            username=user_data["username"],
+            password=user_data["password"],
+            firstname=user_data["firstname"],
+            lastname=user_data["lastname"],
+            role=user_data["role"],
+            organization=org,
+        )
+        user_data["uid"] = user.uid
+
+    def create_org(org_data: Dict[str, Any]) -> Any:
+        org = client.organizations.create_organization(name=org_data["name"])
+        org_data["tag"] = org.tag
+        return org
+
+    def create_project(project_data: Dict[str, Any], org: Any) -> None:
+        project = client.projects.create_project(
+            name=project_data["name"],
+            description=project_data["description"],
+            organization=org,
+        )
+        project_data["pid"] = project.pid
+
+    # The requests are independent within each step, so they are sent
+    # concurrently
+
     # Delete organizations
-    for org in client.organizations.list_organizations():
-        org.delete()
+    utils.run_concurrently(delete, client.organizations.list_organizations())
 
     # Delete users except sysadmin
-    for user in client.users.list_users():
-        if user.username != ADMIN_USERNAME:
-            user.delete()
+    utils.run_concurrently(
+        delete,
+        [user for user in client.users.list_users() if user.username != ADMIN_USERNAME],
+    )
 
     # Create other sysadmins
-    for user_data in DATA["users"].values():
-        if user_data["username"] != ADMIN_USERNAME:
-            user = client.users.create_user(
-                username=user_data["username"],
-                password=user_data["password"],
-                firstname=user_data["firstname"],
-                lastname=user_data["lastname"],
-                role=user_data["role"],
-            )
-            user_data["uid"] = user.uid
+    utils.run_concurrently(
+        create_user,
+        [
+            user_data
+            for user_data in DATA["users"].values()
+            if user_data["username"] != ADMIN_USERNAME
+        ],
+    )
 
     # Create organizations
-    for org_data in DATA["organizations"].values():
-        org = client.organizations.create_organization(name=org_data["name"])
-        org_data["tag"] = org.tag
-
-        # Create organization users
-        for user_data in org_data["users"].values():
-            user = client.users.create_user(
-                username=user_data["username"],
-                password=user_data["password"],
-                firstname=user_data["firstname"],
-                lastname=user_data["lastname"],
-                role=user_data["role"],
-                organization=org,
-            )
-            user_data["uid"] = user.uid
-
-        # Create organization projects
-        for project_data in org_data["projects"].values():
-            project = client.projects.create_project(
-                name=project_data["name"],
-                description=project_data["description"],
-                organization=org,
-            )
-            project_data["pid"] = project.pid
+    org_datas = list(DATA["organizations"].values())
+    orgs = utils.run_concurrently(create_org, org_datas)
+
+    # Create organization users and projects
+    users = [
+        (user_data, org)
+        for org_data, org in zip(org_datas, orgs)
+        for user_data in org_data["users"].values()
+    ]
+    projects = [
+        (project_data, org)
+        for org_data, org in zip(org_datas, orgs)
+        for project_data in org_data["projects"].values()
+    ]
+    utils.run_concurrently(lambda args: create_user(*args), users)
+    utils.run_concurrently(lambda args: create_project(*args), projects)
 
     client.logout()
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def init_data() -> None:
     read_config()
     read_data()
     create_data()
 
 
+@pytest.fixture(autouse=True)
+def require_server(request) -> None:
+    # The server is only set up once a test that needs it runs, tests marked
+    # as unit can run without a server
+    if request.node.get_closest_marker("unit") is None:
+        request.getfixturevalue("init_data")
+
+
 @pytest.fixture
 def data() -> Dict[str, Dict[str, Any]]:
     return DATA
@@ -204,10 +251,98 @@ def data() -> Dict[str, Dict[str, Any]]:
 
 @pytest.fixture
 def awslang() -> List[Dict[str, Any]]:
-    global AWSLANG
-    if AWSLANG is None:
-        AWSLANG = get_awslang()
-    return AWSLANG
+    return get_awslang()
+
+
+@pytest.fixture(scope="session")
+def user_clients(init_data) -> Iterator[Dict[str, Any]]:
+    """Logged in clients of the users in data.json, by username.
+
+    The clients are shared by all tests, so tests must not log them out.
+    """
+    import utils
+
+    clients = {
+        user_data["username"]: utils.get_client(
+            user_data["username"], user_data["password"]
+        )
+        for user_data in DATA["users"].values()
+    }
+    yield clients
+    for client in clients.values():
+        client.logout()
+        client.close()
+
+
+@pytest.fixture(scope="session")
+def org_user_clients(init_data) -> Iterator[Dict[Tuple[str, str], Any]]:
+    """Logged in clients of the organization users in data.json, by
+    organization name and username.
+
+    The clients are shared by all tests, so tests must not log them out.
+    """
+    import utils
+
+    clients = {
+        (org_data["name"], user_data["username"]): utils.get_client_org(
+            user_data["username"], user_data["password"], org_data["name"]
+        )
+        for org_data in DATA["organizations"].values()
+        for user_data in org_data["users"].values()
+    }
+    yield clients
+    for client in clients.values():
+        client.logout()
+        client.close()
+
+
+# The sysadmin and the first organization user are representative of their
+# kind, the other users are marked as regression cases. The users are only
+# known once data.json is read, so the cases list the clients of each kind.
+CLIENT_CASES = [
+    pytest.param(("user", "first"), id="sysadmin"),
+    pytest.param(("user", "others"), id="user-others", marks=pytest.mark.regression),
+    pytest.param(("org_user", "first"), id="org_user"),
+    pytest.param(
+        ("org_user", "others"), id="org_user-others", marks=pytest.mark.regression
+    ),
+    pytest.param(("logged_out", "first"), id="logged_out"),
+]
+
+
+@pytest.fixture(params=CLIENT_CASES)
+def client_case(
+    request, user_clients, org_user_clients, logged_out_client
+) -> Tuple[str, List[Any]]:
+    """The kind of clients, "user", "org_user" or "logged_out", and the clients
+    of that kind to run the test with.
+    """
+    kind, which = request.param
+    if kind == "user":
+        clients = list(user_clients.values())
+    elif kind == "org_user":
+        clients = list(org_user_clients.values())
+    else:
+        clients = [logged_out_client]
+    clients = clients[:1] if which == "first" else clients[1:]
+    # The clients are shared, each test starts without data cached by others
+    for client in clients:
+        client.cache_clear()
+    return kind, clients
+
+
+@pytest.fixture(scope="session")
+def sysadmin_client(user_clients) -> Any:
+    return user_clients[ADMIN_USERNAME]
+
+
+@pytest.fixture(scope="session")
+def logged_out_client(init_data) -> Any:
+    import utils
+
+    client = utils.get_client_sysadmin()
+    client.logout()
+    return client
 
 
 @pytest.fixture()
@@ -235,14 +370,12 @@ def project(data, client, organization):
 
 @pytest.fixture()
 def model_info(data, project, client):
+    # The model file is only read once, every upload gets its own buffer
     name = "aws.sCAD"
-    model_path = Path(__file__).with_name(name)
-    with model_path.open(mode="rb") as reader:
-        model_info = project.upload_scad_model(
-            filename=name, file_io=reader, description=""
-        )
-        yield model_info
-
+    model_info = project.upload_scad_model(
+        filename=name, file_io=io.BytesIO(get_model_bytes(name)), description=""
+    )
+    yield model_info
     model_info.delete()
 
 
@@ -0,0 +1,49 @@
+# Copyright 2020-2022 Foreseeti AB <https://foreseeti.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from securicad.enterprise.cache import TTLCache
+
+pytestmark = pytest.mark.unit
+
+
+def test_refresh():
+    cache = TTLCache(60)
+    token = cache.begin_refresh("a")
+    assert token is not None
+    assert cache.begin_refresh("a") is None, "Key refreshed twice at once"
+    cache.end_refresh("a", token, 1)
+    assert cache.get("a") == 1
+    assert cache.begin_refresh("a") is not None
+
+
+def test_refresh_invalidated():
+    cache = TTLCache(60)
+    token_a = cache.begin_refresh("a")
+    token_b = cache.begin_refresh("b")
+    cache.invalidate("a")
+    cache.end_refresh("a", token_a, 1)
+    cache.end_refresh("b", token_b, 2)
+    # Only the refresh of the invalidated key is discarded
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_refresh_failed():
+    cache = TTLCache(60)
+    token = cache.begin_refresh("a")
+    cache.end_refresh("a", token)
+    assert cache.get("a") is None
+    assert cache.begin_refresh("a") is not None
@@ -12,19 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sys
-from pathlib import Path
-
 import pytest
 import utils
 
-# isort: off
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
 from securicad.enterprise.exceptions import StatusCodeException
 
-# isort: on
-
 
 def test_init(data):
     def assert_init(username, password):
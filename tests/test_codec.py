@@ -0,0 +1,65 @@
+# Copyright 2020-2022 Foreseeti AB <https://foreseeti.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import math
+
+import pytest
+
+from securicad.enterprise import codec
+
+pytestmark = pytest.mark.unit
+
+OBJ = {
+    "name": "model ü",
+    "values": [1, -2, 2.5, None, True, False],
+    "nested": {"empty": [], "object": {}},
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Runs a test with orjson installed and with only the standard library."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(codec, "orjson", None)
+    return request.param
+
+
+def test_dumps(backend):
+    expected = json.dumps(OBJ, separators=(",", ":")).encode("utf-8")
+    assert codec.dumps(OBJ) == expected
+    assert codec.dumps_io(OBJ).read() == expected
+
+
+def test_dumps_non_str_keys(backend):
+    obj = {1: "int", 2.5: "float", False: "bool", None: "none"}
+    expected = b'{"1":"int","2.5":"float","false":"bool","null":"none"}'
+    assert codec.dumps(obj) == expected
+    assert codec.dumps_io(obj).read() == expected
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_dumps_non_finite(backend, value):
+    with pytest.raises(ValueError):
+        codec.dumps({"value": value})
+    with pytest.raises(ValueError):
+        codec.dumps_io({"value": value})
+
+
+def test_loads(backend):
+    data = codec.dumps(OBJ)
+    assert codec.loads(data) == OBJ
+    assert codec.loads(data.decode("utf-8")) == OBJ
@@ -13,32 +13,28 @@
 # limitations under the License.
 
 import random
-import sys
-from pathlib import Path
 from urllib.parse import urljoin
 
 import conftest
 import pytest
 import utils
 
-# isort: off
 
-sys.path.append(str(Path(__file__).resolve().parent.parent))
-import securicad.aws_collector as aws_collector
-import securicad.enterprise as enterprise
-
-# isort: on
+def test_example():
+    # The collector pulls in boto3, so it is only imported when the test runs
+    # pylint: disable=import-outside-toplevel
+    import securicad.aws_collector as aws_collector
 
+    import securicad.enterprise as enterprise
 
-def test_example():
     def get_org_name(client: enterprise.Client) -> str:
-        orgs = client.organizations.list_organizations()
+        # Organization names are compared case-insensitively
+        org_names = {
+            org.name.lower() for org in client.organizations.list_organizations()
+        }
         while True:
             org_name = f"org-{random.randint(1000, 9999)}"
-            for org in orgs:
-                if org.name.lower() == org_name.lower():
-                    break
-            else:
+            if org_name not in org_names:
                 return org_name
 
     # Fetch AWS data
@@ -12,21 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sys
-from pathlib import Path
-
 import pytest
 import utils
 
-# isort: off
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
 from securicad.enterprise.exceptions import StatusCodeException
 
-# isort: on
-
 
-def test_get_metadata(data, awslang):
+def test_get_metadata(awslang, client_case):
     def assert_get_metadata(client):
         metalist = client.metadata.get_metadata()
 
@@ -65,19 +57,9 @@ def test_get_metadata(data, awslang):
             data={"msg": "Missing Authorization Header"},
         )
 
-    for user_data in data["users"].values():
-        client = utils.get_client(user_data["username"], user_data["password"])
-        assert_get_metadata(client)
-        client.logout()
-
-    for org_data in data["organizations"].values():
-        for user_data in org_data["users"].values():
-            client = utils.get_client_org(
-                user_data["username"], user_data["password"], org_data["name"]
-            )
+    kind, clients = client_case
+    for client in clients:
+        if kind == "logged_out":
+            assert_get_metadata_fails(client)
+        else:
             assert_get_metadata(client)
-            client.logout()
-
-    client = utils.get_client_sysadmin()
-    client.logout()
-    assert_get_metadata_fails(client)
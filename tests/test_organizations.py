@@ -12,141 +12,119 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sys
-from pathlib import Path
+import uuid
 
 import pytest
 import utils
 
-# isort: off
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
 from securicad.enterprise import AccessLevel, Organization
-from securicad.enterprise.exceptions import StatusCodeException
 
-# isort: on
+# Errors returned by the organization endpoints, passed to utils.assert_raises_api()
+MISSING_AUTH = {"status_code": 401, "data": {"msg": "Missing Authorization Header"}}
+FORBIDDEN = {
+    "status_code": 403,
+    "data": {
+        "error": "You are not authorized to access this resource: system_admin required."
+    },
+}
+NOT_FOUND = {"status_code": 404, "data": {"error": "Not found"}}
+
 
+def get_org_name():
+    # Each test uses its own names, so it doesn't depend on the other tests
+    return f"org-{uuid.uuid4().hex[:8]}"
 
-def test_list_orgs(data):
+
+def test_list_orgs(data, client_case):
     def assert_list_orgs(client):
         orgs = client.organizations.list_organizations()
         expected_len = len(data["organizations"])
         actual_len = len(orgs)
         assert actual_len == expected_len, f"len(orgs) {actual_len} != {expected_len}"
 
+        orgs_by_name = {org.name: org for org in orgs}
         for org_data in data["organizations"].values():
-            for org in orgs:
-                if org.name == org_data["name"]:
-                    utils.assert_org_data(org, org_data)
-                    break
-            else:
-                assert False, f"Organization \"{org_data['name']}\" not found"
-
-    def assert_list_orgs_fails(client):
-        with pytest.raises(StatusCodeException) as e:
-            client.organizations.list_organizations()
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=401,
-            method="GET",
-            url=utils.get_url("organization/all"),
-            data={"msg": "Missing Authorization Header"},
-        )
-
-    def assert_list_orgs_forbidden(client):
-        with pytest.raises(StatusCodeException) as e:
-            client.organizations.list_organizations()
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=403,
-            method="GET",
-            url=utils.get_url("organization/all"),
-            data={
-                "error": "You are not authorized to access this resource: system_admin required."
-            },
-        )
-
-    for user_data in data["users"].values():
-        client = utils.get_client(user_data["username"], user_data["password"])
-        assert_list_orgs(client)
-        client.logout()
-
-    for org_data in data["organizations"].values():
-        for user_data in org_data["users"].values():
-            client = utils.get_client_org(
-                user_data["username"], user_data["password"], org_data["name"]
+            org = orgs_by_name.get(org_data["name"])
+            assert org is not None, f"Organization \"{org_data['name']}\" not found"
+            utils.assert_org_data(org, org_data)
+
+    kind, clients = client_case
+    for client in clients:
+        if kind == "user":
+            assert_list_orgs(client)
+        else:
+            utils.assert_raises_api(
+                client.organizations.list_organizations,
+                method="GET",
+                url=utils.get_url("organization/all"),
+                **(FORBIDDEN if kind == "org_user" else MISSING_AUTH),
             )
-            assert_list_orgs_forbidden(client)
-            client.logout()
 
-    client = utils.get_client_sysadmin()
-    client.logout()
-    assert_list_orgs_fails(client)
 
-
-def test_get_org_by_tag(data):
+def test_get_org_by_tag(data, client_case):
     def assert_get_org_by_tag(client, org_data):
         org = client.organizations.get_organization_by_tag(org_data["tag"])
         utils.assert_org_data(org, org_data)
 
-    def assert_get_org_by_tag_invalid(client, tag):
-        with pytest.raises(StatusCodeException) as e:
-            client.organizations.get_organization_by_tag(tag)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=404,
+    def assert_get_org_by_tag_fails(client, tag, error):
+        utils.assert_raises_api(
+            lambda: client.organizations.get_organization_by_tag(tag),
             method="GET",
             url=utils.get_url(f"organization/{tag}"),
-            data={"error": "Not found"},
+            **error,
         )
 
-    def assert_get_org_by_tag_fails(client, tag):
-        with pytest.raises(StatusCodeException) as e:
-            client.organizations.get_organization_by_tag(tag)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=401,
-            method="GET",
-            url=utils.get_url(f"organization/{tag}"),
-            data={"msg": "Missing Authorization Header"},
+    kind, clients = client_case
+    for client in clients:
+        if kind == "user":
+            for org in data["organizations"].values():
+                assert_get_org_by_tag(client, org)
+            assert_get_org_by_tag_fails(client, "invalid", NOT_FOUND)
+        elif kind == "org_user":
+            for org in data["organizations"].values():
+                assert_get_org_by_tag_fails(client, org["tag"], FORBIDDEN)
+            assert_get_org_by_tag_fails(client, "invalid", FORBIDDEN)
+        else:
+            assert_get_org_by_tag_fails(client, "invalid", MISSING_AUTH)
+
+
+def test_get_orgs_by_tags(data, client_case):
+    def assert_get_orgs_by_tags(client, orgs_data):
+        orgs = client.organizations.get_organizations_by_tags(
+            [org_data["tag"] for org_data in orgs_data]
         )
+        assert len(orgs) == len(orgs_data), f"len(orgs) {len(orgs)} != {len(orgs_data)}"
+        for org, org_data in zip(orgs, orgs_data):
+            utils.assert_org_data(org, org_data)
 
-    def assert_get_org_by_tag_forbidden(client, tag):
-        with pytest.raises(StatusCodeException) as e:
-            client.organizations.get_organization_by_tag(tag)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=403,
+    def assert_get_orgs_by_tags_fails(client, tags, endpoint, error):
+        utils.assert_raises_api(
+            lambda: client.organizations.get_organizations_by_tags(tags),
             method="GET",
-            url=utils.get_url(f"organization/{tag}"),
-            data={
-                "error": "You are not authorized to access this resource: system_admin required."
-            },
+            url=utils.get_url(endpoint),
+            **error,
         )
 
-    for user_data in data["users"].values():
-        client = utils.get_client(user_data["username"], user_data["password"])
-        for org in data["organizations"].values():
-            assert_get_org_by_tag(client, org)
-        assert_get_org_by_tag_invalid(client, "invalid")
-        client.logout()
-
-    for org_data in data["organizations"].values():
-        for user_data in org_data["users"].values():
-            client = utils.get_client_org(
-                user_data["username"], user_data["password"], org_data["name"]
+    orgs_data = list(data["organizations"].values())
+    tags = [org_data["tag"] for org_data in orgs_data]
+    kind, clients = client_case
+    for client in clients:
+        if kind == "user":
+            assert_get_orgs_by_tags(client, orgs_data)
+            assert_get_orgs_by_tags(client, orgs_data[::-1])
+            assert_get_orgs_by_tags(client, [])
+            assert_get_orgs_by_tags_fails(
+                client, tags + ["invalid"], "organization/invalid", NOT_FOUND
+            )
+        elif kind == "org_user":
+            assert_get_orgs_by_tags_fails(client, tags, "organization/all", FORBIDDEN)
+        else:
+            assert_get_orgs_by_tags_fails(
+                client, tags, "organization/all", MISSING_AUTH
             )
-            for org in data["organizations"].values():
-                assert_get_org_by_tag_forbidden(client, org["tag"])
-            assert_get_org_by_tag_forbidden(client, "invalid")
-            client.logout()
-
-    client = utils.get_client_sysadmin()
-    client.logout()
-    assert_get_org_by_tag_fails(client, "invalid")
 
 
-def test_get_org_by_name(data):
+def test_get_org_by_name(data, client_case):
     def assert_get_org_by_name(client, org_data):
         org = client.organizations.get_organization_by_name(org_data["name"])
         utils.assert_org_data(org, org_data)
@@ -156,53 +134,29 @@ def test_get_org_by_name(data):
             client.organizations.get_organization_by_name(name)
         assert str(e.value) == f"Invalid organization {name}"
 
-    def assert_get_org_by_name_fails(client, name):
-        with pytest.raises(StatusCodeException) as e:
-            client.organizations.get_organization_by_name(name)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=401,
+    def assert_get_org_by_name_fails(client, name, error):
+        utils.assert_raises_api(
+            lambda: client.organizations.get_organization_by_name(name),
             method="GET",
             url=utils.get_url("organization/all"),
-            data={"msg": "Missing Authorization Header"},
+            **error,
         )
 
-    def assert_get_org_by_name_forbidden(client, name):
-        with pytest.raises(StatusCodeException) as e:
-            client.organizations.get_organization_by_name(name)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=403,
-            method="GET",
-            url=utils.get_url("organization/all"),
-            data={
-                "error": "You are not authorized to access this resource: system_admin required."
-            },
-        )
-
-    for user_data in data["users"].values():
-        client = utils.get_client(user_data["username"], user_data["password"])
-        for org in data["organizations"].values():
-            assert_get_org_by_name(client, org)
-        assert_get_org_by_name_invalid(client, "invalid")
-        client.logout()
-
-    for org_data in data["organizations"].values():
-        for user_data in org_data["users"].values():
-            client = utils.get_client_org(
-                user_data["username"], user_data["password"], org_data["name"]
-            )
+    kind, clients = client_case
+    for client in clients:
+        if kind == "user":
             for org in data["organizations"].values():
-                assert_get_org_by_name_forbidden(client, org["name"])
-            assert_get_org_by_name_forbidden(client, "invalid")
-            client.logout()
-
-    client = utils.get_client_sysadmin()
-    client.logout()
-    assert_get_org_by_name_fails(client, "invalid")
+                assert_get_org_by_name(client, org)
+            assert_get_org_by_name_invalid(client, "invalid")
+        elif kind == "org_user":
+            for org in data["organizations"].values():
+                assert_get_org_by_name_fails(client, org["name"], FORBIDDEN)
+            assert_get_org_by_name_fails(client, "invalid", FORBIDDEN)
+        else:
+            assert_get_org_by_name_fails(client, "invalid", MISSING_AUTH)
 
 
-def test_create_org(data):
+def test_create_org(data, user_clients, org_user_clients, logged_out_client):
     def assert_create_org(client, name):
         org = client.organizations.create_organization(name)
         assert (
@@ -210,64 +164,38 @@ def test_create_org(data):
         ), f'Unexpected organization name "{org.name}" != "{name}"'
         org.delete()
 
-    def assert_create_org_invalid(client, name):
-        with pytest.raises(StatusCodeException) as e:
-            client.organizations.create_organization(name)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=400,
-            method="PUT",
-            url=utils.get_url("organization"),
-            data={"error": f"Organization {name} already exists"},
-        )
-
-    def assert_create_org_fails(client, name):
-        with pytest.raises(StatusCodeException) as e:
-            client.organizations.create_organization(name)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=401,
+    def assert_create_org_fails(client, name, error):
+        utils.assert_raises_api(
+            lambda: client.organizations.create_organization(name),
             method="PUT",
             url=utils.get_url("organization"),
-            data={"msg": "Missing Authorization Header"},
+            **error,
         )
 
-    def assert_create_org_forbidden(client, name):
-        with pytest.raises(StatusCodeException) as e:
-            client.organizations.create_organization(name)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=403,
-            method="PUT",
-            url=utils.get_url("organization"),
-            data={
-                "error": "You are not authorized to access this resource: system_admin required."
-            },
-        )
-
-    for user_data in data["users"].values():
-        client = utils.get_client(user_data["username"], user_data["password"])
-        assert_create_org(client, "org3")
+    name = get_org_name()
+    for client in user_clients.values():
+        assert_create_org(client, name)
         for org in data["organizations"].values():
-            assert_create_org_invalid(client, org["name"])
-        client.logout()
-
-    for org_data in data["organizations"].values():
-        for user_data in org_data["users"].values():
-            client = utils.get_client_org(
-                user_data["username"], user_data["password"], org_data["name"]
+            assert_create_org_fails(
+                client,
+                org["name"],
+                {
+                    "status_code": 400,
+                    "data": {"error": f"Organization {org['name']} already exists"},
+                },
             )
-            assert_create_org_forbidden(client, "org3")
-            for org in data["organizations"].values():
-                assert_create_org_forbidden(client, org["name"])
-            client.logout()
 
-    client = utils.get_client_sysadmin()
-    client.logout()
-    assert_create_org_fails(client, "org3")
+    for client in org_user_clients.values():
+        assert_create_org_fails(client, name, FORBIDDEN)
+        for org in data["organizations"].values():
+            assert_create_org_fails(client, org["name"], FORBIDDEN)
+
+    assert_create_org_fails(logged_out_client, name, MISSING_AUTH)
 
 
-def test_org_update(data):
+def test_org_update(
+    data, user_clients, org_user_clients, sysadmin_client, logged_out_client
+):
     def assert_org_update(client, tag, old_name, new_name):
         org = client.organizations.get_organization_by_tag(tag)
         utils.assert_org_data(org, {"tag": tag, "name": old_name})
@@ -278,101 +206,68 @@ def test_org_update(data):
         org = client.organizations.get_organization_by_tag(tag)
         utils.assert_org_data(org, {"tag": tag, "name": new_name})
 
-    def assert_org_update_fails_exists(org, new_name):
-        with pytest.raises(StatusCodeException) as e:
-            org.update(name=new_name)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=400,
-            method="POST",
-            url=utils.get_url("organization"),
-            data={"error": f"Organization {new_name} already exists"},
-        )
-
-    def assert_org_update_fails_missing_auth(org, new_name):
-        with pytest.raises(StatusCodeException) as e:
-            org.update(name=new_name)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=401,
+    def assert_org_update_fails(org, new_name, error):
+        utils.assert_raises_api(
+            lambda: org.update(name=new_name),
             method="POST",
             url=utils.get_url("organization"),
-            data={"msg": "Missing Authorization Header"},
+            **error,
         )
 
-    def assert_org_update_fails_invalid_org(org, new_name):
-        with pytest.raises(StatusCodeException) as e:
-            org.update(name=new_name)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=500,
-            method="POST",
-            url=utils.get_url("organization"),
-            data={"error": "Failed to update organization"},
-        )
-
-    def assert_org_update_fails_forbidden(org, new_name):
-        with pytest.raises(StatusCodeException) as e:
-            org.update(name=new_name)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=403,
-            method="POST",
-            url=utils.get_url("organization"),
-            data={
-                "error": "You are not authorized to access this resource: system_admin required."
-            },
-        )
-
-    for user_data in data["users"].values():
-        client = utils.get_client(user_data["username"], user_data["password"])
+    name = get_org_name()
+    for client in user_clients.values():
+        for org in data["organizations"].values():
+            org_ = Organization(client, org["tag"], org["name"])
+            assert_org_update(client, org["tag"], org["name"], name)
+            assert_org_update(client, org["tag"], name, org["name"])
+            for org_name in data["organizations"]:
+                assert_org_update_fails(
+                    org_,
+                    org_name,
+                    {
+                        "status_code": 400,
+                        "data": {"error": f"Organization {org_name} already exists"},
+                    },
+                )
+
+    # The remaining checks don't change any organization, so they can run
+    # concurrently
+    def assert_org_updates_forbidden(client):
         for org in data["organizations"].values():
             org_ = Organization(client, org["tag"], org["name"])
-            assert_org_update(client, org["tag"], org["name"], "org3")
-            assert_org_update(client, org["tag"], "org3", org["name"])
+            assert_org_update_fails(org_, name, FORBIDDEN)
             for org_name in data["organizations"]:
-                assert_org_update_fails_exists(org_, org_name)
-        client.logout()
+                assert_org_update_fails(org_, org_name, FORBIDDEN)
 
-    for org_data in data["organizations"].values():
-        for user_data in org_data["users"].values():
-            client = utils.get_client_org(
-                user_data["username"], user_data["password"], org_data["name"]
-            )
-            for org in data["organizations"].values():
-                org_ = Organization(client, org["tag"], org["name"])
-                assert_org_update_fails_forbidden(org_, "org3")
-                for org_name in data["organizations"]:
-                    assert_org_update_fails_forbidden(org_, org_name)
-            client.logout()
-
-    client = utils.get_client_sysadmin()
-    client.logout()
-    for org in data["organizations"].values():
-        org_ = Organization(client, org["tag"], org["name"])
-        assert_org_update_fails_missing_auth(org_, "org3")
-
-    client = utils.get_client_sysadmin()
-    org_ = client.organizations.create_organization("org3")
+    def assert_org_update_logged_out(org):
+        org_ = Organization(logged_out_client, org["tag"], org["name"])
+        assert_org_update_fails(org_, name, MISSING_AUTH)
+
+    utils.run_concurrently(assert_org_updates_forbidden, org_user_clients.values())
+    utils.run_concurrently(assert_org_update_logged_out, data["organizations"].values())
+
+    org_ = sysadmin_client.organizations.create_organization(name)
     org_.delete()
-    assert_org_update_fails_invalid_org(org_, "org4")
-    client.logout()
+    assert_org_update_fails(
+        org_,
+        get_org_name(),
+        {"status_code": 500, "data": {"error": "Failed to update organization"}},
+    )
 
 
-def test_org_delete(data):
+def test_org_delete(
+    data, user_clients, org_user_clients, sysadmin_client, logged_out_client
+):
     def assert_org(client, tag, name):
         org = client.organizations.get_organization_by_tag(tag)
         utils.assert_org_data(org, {"tag": tag, "name": name})
 
     def assert_not_org(client, tag):
-        with pytest.raises(StatusCodeException) as e:
-            client.organizations.get_organization_by_tag(tag)
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=404,
+        utils.assert_raises_api(
+            lambda: client.organizations.get_organization_by_tag(tag),
             method="GET",
             url=utils.get_url(f"organization/{tag}"),
-            data={"error": "Not found"},
+            **NOT_FOUND,
         )
 
     def assert_org_delete(client, name):
@@ -382,152 +277,87 @@ def test_org_delete(data):
         org.delete()
         assert_not_org(client, org.tag)
 
-    def assert_org_delete_invalid(org):
-        with pytest.raises(StatusCodeException) as e:
-            org.delete()
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=404,
-            method="DELETE",
-            url=utils.get_url("organization"),
-            data={"error": "Organization not found"},
+    def assert_org_delete_fails(org, error):
+        utils.assert_raises_api(
+            org.delete, method="DELETE", url=utils.get_url("organization"), **error
         )
 
-    def assert_org_delete_fails(org):
-        with pytest.raises(StatusCodeException) as e:
-            org.delete()
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=401,
-            method="DELETE",
-            url=utils.get_url("organization"),
-            data={"msg": "Missing Authorization Header"},
-        )
-
-    def assert_org_delete_forbidden(org):
-        with pytest.raises(StatusCodeException) as e:
-            org.delete()
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=403,
-            method="DELETE",
-            url=utils.get_url("organization"),
-            data={
-                "error": "You are not authorized to access this resource: system_admin required."
-            },
-        )
+    name = get_org_name()
+    for client in user_clients.values():
+        assert_org_delete(client, name)
 
-    for user_data in data["users"].values():
-        client = utils.get_client(user_data["username"], user_data["password"])
-        assert_org_delete(client, "org3")
-        client.logout()
+    # The remaining checks don't delete any organization, so they can run
+    # concurrently
+    def assert_org_deletes_forbidden(client):
+        for org in data["organizations"].values():
+            org_ = Organization(client, org["tag"], org["name"])
+            assert_org_delete_fails(org_, FORBIDDEN)
 
-    for org_data in data["organizations"].values():
-        for user_data in org_data["users"].values():
-            client = utils.get_client_org(
-                user_data["username"], user_data["password"], org_data["name"]
-            )
-            for org in data["organizations"].values():
-                org_ = Organization(client, org["tag"], org["name"])
-                assert_org_delete_forbidden(org_)
-            client.logout()
+    def assert_org_delete_logged_out(org):
+        org_ = Organization(logged_out_client, org["tag"], org["name"])
+        assert_org_delete_fails(org_, MISSING_AUTH)
 
-    client = utils.get_client_sysadmin()
-    client.logout()
-    for org in data["organizations"].values():
-        org_ = Organization(client, org["tag"], org["name"])
-        assert_org_delete_fails(org_)
+    utils.run_concurrently(assert_org_deletes_forbidden, org_user_clients.values())
+    utils.run_concurrently(assert_org_delete_logged_out, data["organizations"].values())
 
-    client = utils.get_client_sysadmin()
-    org_ = client.organizations.create_organization("org3")
+    org_ = sysadmin_client.organizations.create_organization(name)
     org_.delete()
-    assert_org_delete_invalid(org_)
-    client.logout()
+    assert_org_delete_fails(
+        org_, {"status_code": 404, "data": {"error": "Organization not found"}}
+    )
 
 
-def test_org_list_users(data):
+def test_org_list_users(data, client_case):
     def assert_org_list_users(org):
         users = org.list_users()
         expected_len = len(data["organizations"][org.name]["users"])
         actual_len = len(users)
         assert actual_len == expected_len, f"len(users) {actual_len} != {expected_len}"
 
+        users_by_username = {user.username: user for user in users}
         for user_data in data["organizations"][org.name]["users"].values():
-            for user in users:
-                if user.username == user_data["username"]:
-                    utils.assert_user_data(user, user_data)
-                    break
-            else:
-                assert (
-                    False
-                ), f"User \"{user_data['name']}\" not found in organization \"{org.name}\""
-
-    def assert_org_list_users_invalid(org):
-        with pytest.raises(StatusCodeException) as e:
-            org.list_users()
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=404,
-            method="GET",
-            url=utils.get_url(f"organization/{org.tag}"),
-            data={"error": "Not found"},
-        )
-
-    def assert_org_list_users_fails(org):
-        with pytest.raises(StatusCodeException) as e:
-            org.list_users()
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=401,
-            method="GET",
-            url=utils.get_url(f"organization/{org.tag}"),
-            data={"msg": "Missing Authorization Header"},
-        )
-
-    def assert_org_list_users_forbidden(org):
-        with pytest.raises(StatusCodeException) as e:
-            org.list_users()
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=403,
+            user = users_by_username.get(user_data["username"])
+            assert (
+                user is not None
+            ), f"User \"{user_data['username']}\" not found in organization \"{org.name}\""
+            utils.assert_user_data(user, user_data)
+
+    def assert_org_list_users_fails(org, error):
+        utils.assert_raises_api(
+            org.list_users,
             method="GET",
             url=utils.get_url(f"organization/{org.tag}"),
-            data={
-                "error": "You are not authorized to access this resource: system_admin required."
-            },
+            **error,
         )
 
-    for user_data in data["users"].values():
-        client = utils.get_client(user_data["username"], user_data["password"])
-        for org in data["organizations"].values():
-            org_ = Organization(client, org["tag"], org["name"])
-            assert_org_list_users(org_)
-        client.logout()
-
-    for org_data in data["organizations"].values():
-        for user_data in org_data["users"].values():
-            client = utils.get_client_org(
-                user_data["username"], user_data["password"], org_data["name"]
-            )
+    kind, clients = client_case
+    for client in clients:
+        if kind == "user":
+            for org in data["organizations"].values():
+                org_ = Organization(client, org["tag"], org["name"])
+                assert_org_list_users(org_)
+        elif kind == "org_user":
+            for org in data["organizations"].values():
+                org_ = Organization(client, org["tag"], org["name"])
+                assert_org_list_users_fails(org_, FORBIDDEN)
+        else:
             for org in data["organizations"].values():
                 org_ = Organization(client, org["tag"], org["name"])
-                assert_org_list_users_forbidden(org_)
-            client.logout()
+                assert_org_list_users_fails(org_, MISSING_AUTH)
 
-    client = utils.get_client_sysadmin()
-    client.logout()
-    for org in data["organizations"].values():
-        org_ = Organization(client, org["tag"], org["name"])
-        assert_org_list_users_fails(org_)
 
-    client = utils.get_client_sysadmin()
-    org_ = client.organizations.create_organization("org3")
-    org_.delete()
-    assert_org_list_users_invalid(org_)
-    client.logout()
+def test_org_list_users_deleted(sysadmin_client):
+    org = sysadmin_client.organizations.create_organization(get_org_name())
+    org.delete()
+    utils.assert_raises_api(
+        org.list_users,
+        method="GET",
+        url=utils.get_url(f"organization/{org.tag}"),
+        **NOT_FOUND,
+    )
 
 
-def test_org_list_projects(data):
+def test_org_list_projects(data, client_case):
     def assert_org_list_projects(org):
         projects = org.list_projects()
         expected_len = len(data["organizations"][org.name]["projects"])
@@ -536,76 +366,44 @@ def test_org_list_projects(data):
             actual_len == expected_len
         ), f"len(projects) {actual_len} != {expected_len}"
 
+        projects_by_name = {project.name: project for project in projects}
         for project_data in data["organizations"][org.name]["projects"].values():
-            for project in projects:
-                if project.name == project_data["name"]:
-                    utils.assert_project_data(project, project_data, AccessLevel.ADMIN)
-                    break
-            else:
-                assert (
-                    False
-                ), f"Project \"{project_data['name']}\" not found in organization \"{org.name}\""
-
-    def assert_org_list_projects_invalid(org):
-        with pytest.raises(StatusCodeException) as e:
-            org.list_projects()
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=404,
-            method="GET",
-            url=utils.get_url(f"organization/{org.tag}"),
-            data={"error": "Not found"},
-        )
-
-    def assert_org_list_projects_fails(org):
-        with pytest.raises(StatusCodeException) as e:
-            org.list_projects()
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=401,
-            method="GET",
-            url=utils.get_url(f"organization/{org.tag}"),
-            data={"msg": "Missing Authorization Header"},
-        )
-
-    def assert_org_list_projects_forbidden(org):
-        with pytest.raises(StatusCodeException) as e:
-            org.list_projects()
-        utils.assert_status_code_exception(
-            exception=e.value,
-            status_code=403,
+            project = projects_by_name.get(project_data["name"])
+            assert (
+                project is not None
+            ), f"Project \"{project_data['name']}\" not found in organization \"{org.name}\""
+            utils.assert_project_data(project, project_data, AccessLevel.ADMIN)
+
+    def assert_org_list_projects_fails(org, error):
+        utils.assert_raises_api(
+            org.list_projects,
             method="GET",
             url=utils.get_url(f"organization/{org.tag}"),
-            data={
-                "error": "You are not authorized to access this resource: system_admin required."
-            },
+            **error,
         )
 
-    for user_data in data["users"].values():
-        client = utils.get_client(user_data["username"], user_data["password"])
-        for org in data["organizations"].values():
-            org_ = Organization(client, org["tag"], org["name"])
-            assert_org_list_projects(org_)
-        client.logout()
-
-    for org_data in data["organizations"].values():
-        for user_data in org_data["users"].values():
-            client = utils.get_client_org(
-                user_data["username"], user_data["password"], org_data["name"]
-            )
+    kind, clients = client_case
+    for client in clients:
+        if kind == "user":
             for org in data["organizations"].values():
                 org_ = Organization(client, org["tag"], org["name"])
-                assert_org_list_projects_forbidden(org_)
-            client.logout()
-
-    client = utils.get_client_sysadmin()
-    client.logout()
-    for org in data["organizations"].values():
-        org_ = Organization(client, org["tag"], org["name"])
-        assert_org_list_projects_fails(org_)
-
-    client = utils.get_client_sysadmin()
-    org_ = client.organizations.create_organization("org3")
-    org_.delete()
-    assert_org_list_projects_invalid(org_)
-    client.logout()
+                assert_org_list_projects(org_)
+        elif kind == "org_user":
+            for org in data["organizations"].values():
+                org_ = Organization(client, org["tag"], org["name"])
+                assert_org_list_projects_fails(org_, FORBIDDEN)
+        else:
+            for org in data["organizations"].values():
+                org_ = Organization(client, org["tag"], org["name"])
+                assert_org_list_projects_fails(org_, MISSING_AUTH)
+
+
+def test_org_list_projects_deleted(sysadmin_client):
+    org = sysadmin_client.organizations.create_organization(get_org_name())
+    org.delete()
+    utils.assert_raises_api(
+        org.list_projects,
+        method="GET",
+        url=utils.get_url(f"organization/{org.tag}"),
+        **NOT_FOUND,
+    )
@@ -12,18 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sys
-from pathlib import Path
-
 import pytest
 import utils
 
-# isort: off
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
 from securicad.enterprise.exceptions import StatusCodeException
-
-# isort: on
+from securicad.enterprise.util import parsers
 
 PARSERS = [{"name": "aws-parser", "sub_parsers": ["aws-cli-parser", "aws-vul-parser"]}]
 
@@ -110,5 +103,18 @@ def test_list_parsers(data):
     assert_list_parsers_fails(client)
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("files", [(None, None), ([], None), (None, []), ([], [])])
+def test_generate_model_without_files(files):
+    # The input is checked before the project is used
+    project = object()
+    with pytest.raises(ValueError) as e:
+        parsers.generate_aws_model(project, "model", *files)
+    assert str(e.value) == "No AWS files to generate a model from"
+    with pytest.raises(ValueError) as e:
+        parsers.generate_azure_model(project, "model", *files)
+    assert str(e.value) == "No Azure files to generate a model from"
+
+
 # TODO:
 # test_generate_aws_model()
@@ -12,23 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sys
 import uuid
 from pathlib import Path
 
 import pytest
 import utils
 
-# isort: off
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
 from securicad.enterprise.exceptions import StatusCodeException
-
 from securicad.enterprise.projects import AccessLevel
 from securicad.enterprise.users import Role
 
-# isort: on
-
 
 def test_list_projects(data, client):
     assert len(client.projects.list_projects()) == len(
@@ -36,6 +29,15 @@ def test_list_projects(data, client):
     )
 
 
+def test_iter_projects(client):
+    projects = client.projects.iter_projects()
+    assert iter(projects) is projects
+    assert [(proj.pid, proj.name, proj.access_level) for proj in projects] == [
+        (proj.pid, proj.name, proj.access_level)
+        for proj in client.projects.list_projects()
+    ]
+
+
 def test_get_project_by_pid(data, client):
     for org_data in data["organizations"].values():
         for project_data in org_data["projects"].values():
@@ -132,6 +134,37 @@ def test_project_remove_user(client, organization):
     proj.delete()
 
 
+def test_project_add_remove_users(client, organization):
+    users = [
+        client.users.create_user(
+            username=f"user{i}",
+            password="psw",
+            firstname="f",
+            lastname="l",
+            role=Role.USER,
+            organization=organization,
+        )
+        for i in range(3)
+    ]
+    proj = client.projects.create_project(
+        name=str(uuid.uuid4()), description=str(uuid.uuid4()), organization=organization
+    )
+    creator_uids = {user.uid for user in proj.list_users()}
+    uids = {user.uid for user in users}
+
+    proj.add_users(users, AccessLevel.USER)
+    assert {user.uid for user in proj.list_users()} == creator_uids | uids
+    for user in users:
+        assert proj.get_access_level(user) == AccessLevel.USER
+
+    proj.remove_users(users[1:])
+    assert {user.uid for user in proj.list_users()} == creator_uids | {users[0].uid}
+
+    for user in users:
+        user.delete()
+    proj.delete()
+
+
 def test_project_get_access_level(client, organization):
     proj = client.projects.create_project(
         name=str(uuid.uuid4()), description=str(uuid.uuid4()), organization=organization
@@ -175,6 +208,38 @@ def test_project_set_access_level(client, organization):
     proj.delete()
 
 
+def test_project_list_access_levels(client, organization):
+    proj = client.projects.create_project(
+        name=str(uuid.uuid4()), description=str(uuid.uuid4()), organization=organization
+    )
+    expected = {user.uid: level for user, level in proj.list_access_levels()}
+    users = []
+    for i, level in enumerate(AccessLevel):
+        user = client.users.create_user(
+            username=f"user{i}",
+            password="psw",
+            firstname="f",
+            lastname="l",
+            role=Role.USER,
+            organization=organization,
+        )
+        proj.add_user(user, level)
+        users.append(user)
+        expected[user.uid] = level
+
+    access_levels = proj.list_access_levels()
+    assert {user.uid: level for user, level in access_levels} == expected
+    assert {user.uid for user, _ in access_levels} == {
+        user.uid for user in proj.list_users()
+    }
+    for user, level in access_levels:
+        assert proj.get_access_level(user) == level
+
+    for user in users:
+        user.delete()
+    proj.delete()
+
+
 def test_list_models(project):
     assert project.list_models() == []
     modelpath = Path(__file__).with_name("aws.sCAD")
@@ -12,19 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sys
 import uuid
-from pathlib import Path
 
 import pytest
 import utils
 
-# isort: off
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
 from securicad.enterprise.exceptions import StatusCodeException
 
-# isort: on
+
 def test_list_create_scenario(project, model_info):
     assert project.list_scenarios() == []
     name = str(uuid.uuid4())
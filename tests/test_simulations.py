@@ -12,19 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sys
+import asyncio
 import uuid
-from pathlib import Path
 
 import pytest
 import utils
 
-# isort: off
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
-from securicad.enterprise.exceptions import StatusCodeException
-
-# isort: on
+from securicad.enterprise.exceptions import (
+    SimulationFailedException,
+    StatusCodeException,
+)
+from securicad.enterprise.simulations import Simulation, Simulations
 
 
 def test_list_simulations(scenario):
@@ -64,6 +62,121 @@ def test_delete_simulation(scenario, model):
     assert len(scenario.list_simulations()) == 1
 
 
+def test_delete_prefetched_simulation(scenario, model):
+    simulation = scenario.create_simulation(name=str(uuid.uuid4()), model=model)
+    with utils.get_client_sysadmin(prefetch=True) as client:
+        project = client.projects.get_project_by_pid(scenario.pid)
+        prefetched = project.get_scenario_by_tid(scenario.tid)
+        project.get_scenario_by_tid(scenario.tid).get_simulation_by_simid(
+            simulation.simid
+        ).delete()
+        # The simulations fetched before the deletion are discarded
+        simids = {sim.simid for sim in prefetched.list_simulations()}
+        assert simulation.simid not in simids
+        client.logout()
+
+
+def test_wait_for_simulations(scenario, model):
+    simulations = [
+        scenario.create_simulation(name=str(uuid.uuid4()), model=model)
+        for _ in range(2)
+    ]
+    scenario.client.simulations.wait_for_simulations(simulations)
+    for simulation in simulations:
+        assert simulation.progress == 100, simulation.progress
+
+
+def test_await_for_simulations(scenario, model):
+    simulations = [
+        scenario.create_simulation(name=str(uuid.uuid4()), model=model)
+        for _ in range(2)
+    ]
+    asyncio.run(scenario.client.simulations.await_for_simulations(simulations))
+    for simulation in simulations:
+        assert simulation.progress == 100, simulation.progress
+
+
+class PollingClient:
+    """Stands in for a client, simulations/data returns the progress values
+    one at a time.
+    """
+
+    _base_url = "https://localhost/"
+
+    def __init__(self, progress):
+        self.progress = list(progress)
+        self.simulations = Simulations(self)
+
+    def _post(self, endpoint, data):
+        assert endpoint == "simulations/data", endpoint
+        progress = self.progress.pop(0)
+        return {simid: {"progress": progress} for simid in data["simids"]}
+
+    async def _run_async(self, func, *args):
+        return func(*args)
+
+
+@pytest.mark.unit
+def test_simulation_failed():
+    client = PollingClient([50, -1])
+    simulation = Simulation(client, "pid", "1", "simid", "name", 0)
+    with pytest.raises(SimulationFailedException) as e:
+        simulation.get_results()
+    assert e.value.simid == "simid"
+    assert e.value.name == "name"
+    assert simulation.progress == -1
+    assert client.progress == []
+
+
+@pytest.mark.unit
+def test_simulation_failed_async():
+    client = PollingClient([50, -1])
+    simulation = Simulation(client, "pid", "1", "simid", "name", 0)
+    with pytest.raises(SimulationFailedException) as e:
+        asyncio.run(simulation.aget_results())
+    assert e.value.simid == "simid"
+    assert simulation.progress == -1
+
+
+class RawResultsClient:
+    """Stands in for a client, simulation/raw_data returns ``csv_data``."""
+
+    _base_url = "https://localhost/"
+
+    def __init__(self, csv_data):
+        self.csv_data = csv_data
+        self.simulations = Simulations(self)
+
+    def _post(self, endpoint, data):
+        assert endpoint == "simulation/raw_data", endpoint
+        return {"csv_data": self.csv_data}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "csv_data, raw_result",
+    [
+        ('a\nb\n"samplecount=1"\n"build=1"\nc,d\n1,2\n', "c,d\n1,2\n"),
+        ('a\nb\n"samplecount=1"\n"build=1"\n', ""),
+        ('a\nb\n"samplecount=1"\n"build=1"', ""),
+        ("a\nb\nc,d\n1,2", "a\nb\nc,d\n1,2"),
+    ],
+)
+def test_simulation_get_raw_results(csv_data, raw_result):
+    simulation = Simulation(RawResultsClient(csv_data), "pid", "1", "simid", "s", 100)
+    assert simulation.get_raw_results() == raw_result
+    assert list(simulation.iter_raw_results()) == raw_result.splitlines()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("csv_data", ["", "a", "a\nb", 'a\nb\n"samplecount=1"'])
+def test_simulation_get_raw_results_invalid(csv_data):
+    simulation = Simulation(RawResultsClient(csv_data), "pid", "1", "simid", "s", 100)
+    with pytest.raises(ValueError) as e:
+        simulation.get_raw_results()
+    assert str(e.value) == "Invalid raw results, expected at least 4 lines"
+
+
 def test_simulation_get_results(scenario):
     sim = scenario.get_simulation_by_name(name="Initial simulation")
     results = sim.get_results()
@@ -12,18 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sys
-from pathlib import Path
 from typing import Any, Dict, Optional
 
-# isort: off
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
 from securicad.enterprise.projects import Project
 from securicad.enterprise.tunings import Tuning
 
-# isort: on
-
 
 def verify_tuning_response(
     tuning: Tuning,
@@ -811,3 +804,57 @@ def test_list(project):
     )
     curr_tunings = project.list_tunings()
     assert len(curr_tunings) == 1, curr_tunings
+
+
+def test_create_tunings(project):
+    tunings = project.create_tunings(
+        [
+            {
+                "tuning_type": "attacker",
+                "filterdict": {
+                    "attackstep": "HighPrivilegeAccess",
+                    "object_name": "i-1",
+                },
+            },
+            {"tuning_type": "ttc", "filterdict": {}, "ttc": "Exponential,3"},
+            {
+                "tuning_type": "tag",
+                "filterdict": {"metaconcept": "EC2Instance", "object_name": "i-1"},
+                "tags": {"a": "b"},
+            },
+        ]
+    )
+    assert len(tunings) == 3, tunings
+    verify_tuning_response(
+        tunings[0],
+        project=project,
+        tuning_type="attacker",
+        op="apply",
+        filter_object_name="i-1",
+        filter_attackstep="HighPrivilegeAccess",
+    )
+    verify_tuning_response(
+        tunings[1],
+        project=project,
+        tuning_type="ttc",
+        op="apply",
+        ttc="Exponential,3",
+    )
+    verify_tuning_response(
+        tunings[2],
+        project=project,
+        tuning_type="tag",
+        op="apply",
+        filter_metaconcept="EC2Instance",
+        filter_object_name="i-1",
+        tags={"a": "b"},
+    )
+
+    listed = {tuning.tuning_id: tuning for tuning in project.list_tunings()}
+    assert set(listed) == {tuning.tuning_id for tuning in tunings}
+    for tuning in tunings:
+        listed_tuning = listed[tuning.tuning_id]
+        assert listed_tuning.tuning_type == tuning.tuning_type
+        assert listed_tuning.filter_object_name == tuning.filter_object_name
+        assert listed_tuning.ttc == tuning.ttc
+        assert listed_tuning.tags == tuning.tags
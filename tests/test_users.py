@@ -12,19 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sys
-from pathlib import Path
+import itertools
 
 import pytest
 import utils
 
-# isort: off
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
-from securicad.enterprise.users import Role
 from securicad.enterprise.exceptions import StatusCodeException
+from securicad.enterprise.users import Role
 
-# isort: on
+
+@pytest.mark.unit
+def test_role_from_list():
+    def get_role(roles):
+        # The comparison of sorted lists that Role.from_list() replaced
+        for role in Role:
+            if sorted(roles) == sorted(role.value):
+                return role
+        return None
+
+    # Every ordering of every combination of names, with repeated and unknown names
+    names = sorted({name for role in Role for name in role.value}) + ["invalid"]
+    for length in range(len(names) + 1):
+        for roles in itertools.product(names, repeat=length):
+            roles = list(roles)
+            role = get_role(roles)
+            if role is None:
+                with pytest.raises(ValueError):
+                    Role.from_list(roles)
+            else:
+                assert Role.from_list(roles) == role, roles
 
 
 def test_whoami(data):
@@ -205,6 +221,14 @@ def test_list_users_sysadmin(client):
     )
 
 
+def test_iter_users(client):
+    users = client.users.iter_users()
+    assert iter(users) is users
+    assert [(user.uid, user.username, user.role) for user in users] == [
+        (user.uid, user.username, user.role) for user in client.users.list_users()
+    ]
+
+
 def test_list_users_orgadmin(data):
     org1 = data["organizations"]["org1"]
     admin = [
@@ -12,26 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import json
-import sys
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
 from urllib.parse import urljoin
 
 import conftest
+import pytest
 
-# isort: off
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
 import securicad.enterprise
+from securicad.enterprise.exceptions import StatusCodeException
 
 if TYPE_CHECKING:
     from securicad.enterprise import AccessLevel, Client, Organization, Project, User
-    from securicad.enterprise.exceptions import StatusCodeException
-
-# isort: on
 
 
+# The config is read once at the start of the session, before any URL is built
+@functools.lru_cache(maxsize=None)
 def get_url(endpoint: str) -> str:
     if conftest.BACKEND_URL is None:
         backend_url = conftest.BASE_URL
@@ -41,13 +39,16 @@ def get_url(endpoint: str) -> str:
     return urljoin(backend_url, endpoint)
 
 
-def get_client(username: str, password: str) -> "Client":
+# Every client builds its own requests.Session. The session headers hold the
+# client's access token, so clients can't share a session.
+def get_client(username: str, password: str, **kwargs: Any) -> "Client":
     return securicad.enterprise.client(
         base_url=conftest.BASE_URL,
         backend_url=conftest.BACKEND_URL,
         username=username,
         password=password,
         cacert=False,
+        **kwargs,
     )
 
 
@@ -64,8 +65,16 @@ def get_client_org(
     )
 
 
-def get_client_sysadmin() -> "Client":
-    return get_client(conftest.ADMIN_USERNAME, conftest.ADMIN_PASSWORD)
+def get_client_sysadmin(**kwargs: Any) -> "Client":
+    return get_client(conftest.ADMIN_USERNAME, conftest.ADMIN_PASSWORD, **kwargs)
+
+
+def run_concurrently(func: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+    """Calls func for each item on a thread pool and returns the results in
+    order. The first exception, e.g. a failed assertion, is raised.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(func, items))
 
 
 def assert_access_token(client: "Client") -> None:
@@ -77,7 +86,7 @@ def assert_not_access_token(client: "Client") -> None:
 
 
 def assert_status_code_exception(
-    exception: "StatusCodeException", status_code: int, method: str, url: str, data: Any
+    exception: StatusCodeException, status_code: int, method: str, url: str, data: Any
 ) -> None:
     assert (
         exception.status_code == status_code
@@ -92,6 +101,17 @@ def assert_status_code_exception(
     ), f"Invalid data\nExpected:\n{content}\nActual:\n{exception.content}"
 
 
+def assert_raises_api(
+    func: Callable[[], Any], *, status_code: int, method: str, url: str, data: Any
+) -> None:
+    """Calls func and checks that it fails with the given API error."""
+    with pytest.raises(StatusCodeException) as e:
+        func()
+    assert_status_code_exception(
+        exception=e.value, status_code=status_code, method=method, url=url, data=data
+    )
+
+
 def assert_org_data(org: "Organization", org_data: Dict[str, Any]) -> None:
     assert (
         org.tag == org_data["tag"]